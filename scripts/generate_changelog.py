@@ -15,6 +15,21 @@ import subprocess
 import sys
 from collections import defaultdict
 from pathlib import Path
+from typing import NamedTuple
+
+VERSION_LINE_RE = re.compile(
+    r"## \[(\d+\.\d+\.\d+)\](?:\((.*?)\))?(?: - (\d{4}-\d{2}-\d{2})$)?"
+)
+COMMIT_LINE_RE = re.compile(r"- .+?`([a-f0-9]+)`.*")
+
+
+class ParsedChangelog(NamedTuple):
+    """Everything process_changelog needs, collected in one pass."""
+
+    header: str
+    versions: list[tuple[str, str, list[tuple[str, str]]]]
+    compare_urls: dict[str, str]
+    all_versions: list[str]
 
 
 def run_auto_changelog(file_path: Path = Path("docs/changelog.md")):
@@ -28,7 +43,8 @@ def run_auto_changelog(file_path: Path = Path("docs/changelog.md")):
         subprocess.run(
             ["auto-changelog", "-o", str(file_path)],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         print("Generated changelog with auto-changelog")
@@ -43,6 +59,61 @@ def run_auto_changelog(file_path: Path = Path("docs/changelog.md")):
         sys.exit(1)
 
 
+def version_key(version: str) -> tuple[int, ...]:
+    """Sort key for dotted numeric versions."""
+    return tuple(int(part) for part in version.split("."))
+
+
+def parse_changelog(content: str) -> ParsedChangelog:
+    """
+    Parse auto-changelog output line by line in a single pass.
+
+    The header is everything before the first version heading. A dated
+    "## [x.y.z](url) - YYYY-MM-DD" heading followed by a blank line opens a
+    release block that collects (hash, commit line) pairs until the next "## ["
+    heading.
+    """
+    header_lines: list[str] = []
+    in_header = True
+    versions: list[tuple[str, str, list[tuple[str, str]]]] = []
+    compare_urls: dict[str, str] = {}
+    all_versions: list[str] = []
+    pending_release = None
+    commits = None
+
+    for line in content.splitlines(keepends=True):
+        if line.startswith("## ["):
+            pending_release = commits = None
+            match = VERSION_LINE_RE.match(line)
+            if match:
+                version, compare_url, date_str = match.groups()
+                in_header = False
+                all_versions.append(version)
+                if compare_url is not None:
+                    compare_urls.setdefault(version, compare_url)
+                if date_str:
+                    pending_release = (version, date_str)
+        elif pending_release is not None:
+            # A release heading only counts when followed by a blank line
+            if line == "\n":
+                commits = []
+                versions.append((*pending_release, commits))
+            pending_release = None
+        elif commits is not None:
+            commit_match = COMMIT_LINE_RE.search(line)
+            if commit_match:
+                # Fix formatting in commit messages
+                commits.append(
+                    (commit_match.group(1), commit_match.group(0).replace("### ", ""))
+                )
+
+        if in_header:
+            header_lines.append(line)
+
+    header = "" if in_header else "".join(header_lines)
+    return ParsedChangelog(header, versions, compare_urls, all_versions)
+
+
 def process_changelog(file_path=Path("docs/changelog.md")):
     """
     Process the changelog to remove empty releases and group by date
@@ -60,25 +131,21 @@ def process_changelog(file_path=Path("docs/changelog.md")):
         # Read the changelog file
         content = file_path.read_text()
 
-        # Extract the header (everything before the first version)
-        header_match = re.search(r"^(.*?)(?=## \[\d+\.\d+\.\d+\])", content, re.DOTALL)
-        header = header_match.group(1) if header_match else ""
+        changelog = parse_changelog(content)
+        header = changelog.header
+        versions = changelog.versions
+        compare_urls = changelog.compare_urls
 
-        # Extract all version blocks
-        version_pattern = r"## \[(\d+\.\d+\.\d+)\](?:\(.*?\))? - (\d{4}-\d{2}-\d{2})\n\n(.*?)(?=## \[|\Z)"
-        versions = re.findall(version_pattern, content, re.DOTALL)
-
-        # Group versions by date
+        # Group versions by date, skipping empty releases (no actual commits)
         date_groups = defaultdict(list)
-        for version, date_str, changes in versions:
-            # Check if this is an empty release (no actual commits)
-            has_commits = bool(re.search(r"- .+`[a-f0-9]+`", changes))
-
-            if has_commits:
-                # Extract all commit lines
-                commit_lines = re.findall(r"- .+`[a-f0-9]+`.*", changes)
+        for version, date_str, commit_lines in versions:
+            if commit_lines:
                 date_groups[date_str].append((version, commit_lines))
 
+        # Order every version heading once to find the release before each one
+        ordered_versions = sorted(set(changelog.all_versions), key=version_key)
+        previous_versions = dict(zip(ordered_versions[1:], ordered_versions))
+
         # Build the new changelog content
         new_content = header
 
@@ -91,9 +158,7 @@ def process_changelog(file_path=Path("docs/changelog.md")):
 
             # Sort versions in descending order
             sorted_versions = sorted(
-                versions_data,
-                key=lambda x: [int(p) for p in x[0].split(".")],
-                reverse=True,
+                versions_data, key=lambda x: version_key(x[0]), reverse=True
             )
 
             # Get the highest and lowest versions for this date
@@ -105,63 +170,31 @@ def process_changelog(file_path=Path("docs/changelog.md")):
                 # Order should be lowest to highest for the range display
                 version_header = f"### [{lowest_version} - {highest_version}]"
 
-                # Find the version before the lowest version for the compare URL
-                # First, extract all versions from the content
-                all_versions = re.findall(r"## \[(\d+\.\d+\.\d+)\]", content)
-                all_versions = sorted(
-                    all_versions, key=lambda v: [int(p) for p in v.split(".")]
-                )
-
-                # Find the version before the lowest version in this group
-                try:
-                    lowest_version_index = all_versions.index(lowest_version)
-                    if lowest_version_index > 0:
-                        version_before_lowest = all_versions[lowest_version_index - 1]
-                        compare_url = f"(https://github.com/Blacksuan19/structx/compare/{version_before_lowest}...{highest_version})"
-                        version_header += compare_url
-                except (ValueError, IndexError):
-                    # Fallback if we can't determine the previous version
-                    pass
+                # Compare from the version before the lowest version in this group
+                version_before_lowest = previous_versions.get(lowest_version)
+                if version_before_lowest:
+                    compare_url = f"(https://github.com/Blacksuan19/structx/compare/{version_before_lowest}...{highest_version})"
+                    version_header += compare_url
             else:
                 # Just one version for this day
                 version_header = f"### [{highest_version}]"
 
                 # Try to get compare URL
-                compare_match = re.search(
-                    r"\[" + re.escape(highest_version) + r"\]\((.*?)\)", content
-                )
-
-                if compare_match:
-                    compare_url = compare_match.group(1)
+                compare_url = compare_urls.get(highest_version)
+                if compare_url:
                     version_header += f"({compare_url})"
 
             new_content += f"{version_header}\n\n"
 
-            # Collect all commit lines from all versions for this date
-            all_commits = []
+            # Collect commits from all versions for this date, keeping the
+            # first line seen for each hash
+            unique_commits: dict[str, str] = {}
             for _, commits in sorted_versions:
-                for commit in commits:
-                    # Fix formatting in commit messages
-                    fixed_commit = re.sub(r"### ", "", commit)
-                    all_commits.append(fixed_commit)
-
-            # Remove duplicates while preserving order
-            unique_commits = []
-            seen = set()
-            for commit in all_commits:
-                # Use hash part as key to identify duplicates
-                hash_match = re.search(r"`([a-f0-9]+)`", commit)
-                if hash_match:
-                    hash_key = hash_match.group(1)
-                    if hash_key not in seen:
-                        seen.add(hash_key)
-                        unique_commits.append(commit)
-                else:
-                    # No hash found, keep it anyway
-                    unique_commits.append(commit)
+                for commit_hash, commit in commits:
+                    unique_commits.setdefault(commit_hash, commit)
 
             # Add all unique commits
-            new_content += "\n".join(unique_commits) + "\n\n"
+            new_content += "\n".join(unique_commits.values()) + "\n\n"
 
         # Write the updated changelog
         file_path.write_text(new_content)
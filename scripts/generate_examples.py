@@ -1,53 +1,171 @@
-import json
+import asyncio
+import hashlib
 import os
+import subprocess
 import sys
 from datetime import datetime
-from io import StringIO
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from textwrap import dedent
+from types import SimpleNamespace
+from typing import Awaitable, List, Optional, Tuple, Type, Union
 
-from structx import Extractor
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json, to_json
+
+from structx import Extractor, __version__
 from structx.core.models import ExtractionResult
-from structx.utils.usage import ExtractorUsage
+from structx.utils.types import DictStrAny
+from structx.utils.usage import ExtractionStep, ExtractorUsage
+
+RESPONSE_CACHE_DIR = Path(".cache/examples")
+SCHEMA_CACHE_DIR = RESPONSE_CACHE_DIR / "schemas"
+INPUTS_STAMP_PATH = RESPONSE_CACHE_DIR / "examples.sha"
+EXAMPLE_INPUT_DIR = Path("scripts/example_input")
+
+SETUP_CODE = """from structx import Extractor
+from pathlib import Path
+import os
+
+# Initialize the extractor
+extractor = Extractor.from_litellm(
+    model="openai/gpt-4o",
+    api_key="your-api-key"
+)"""
+
+# UTF-8 page content accumulates here and is written once at the end of a run
+_OUT = bytearray()
+
+
+def emit(*lines: Union[str, bytes]):
+    """Append lines to the examples page; encoded JSON is appended as-is."""
+    for line in lines:
+        _OUT.extend(line if isinstance(line, bytes) else line.encode("utf-8"))
+        _OUT.extend(b"\n")
+
+
+def enable_response_cache(cache_dir: Path = RESPONSE_CACHE_DIR):
+    """Reuse identical LLM responses across example generation runs."""
+    import litellm
+
+    try:
+        litellm.cache = litellm.Cache(type="disk", disk_cache_dir=str(cache_dir))
+    except ModuleNotFoundError:
+        print(
+            "Warning: diskcache is not installed; generating examples without "
+            "a response cache. Install it with 'pip install diskcache'.",
+            file=sys.stderr,
+        )
+
+
+def generated_at() -> str:
+    """Return the last commit time so unchanged trees render identical pages."""
+    try:
+        committed = subprocess.run(
+            ["git", "log", "-1", "--format=%cI"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        return datetime.fromisoformat(committed).strftime("%Y-%m-%d %H:%M:%S")
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+@lru_cache(maxsize=None)
+def source_digest() -> str:
+    """Hash the structx sources, which include the planning prompts."""
+    digest = hashlib.sha256()
+    for path in sorted(Path("structx").rglob("*.py")):
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def inputs_digest() -> str:
+    """Hash every file that can change the generated examples page."""
+    digest = hashlib.sha256(source_digest().encode())
+    script_path = Path(__file__)
+    digest.update(script_path.name.encode())
+    digest.update(script_path.read_bytes())
+    for path in sorted(EXAMPLE_INPUT_DIR.iterdir()):
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+async def cached_schema(
+    extractor: Extractor, query: str, data_path: Path
+) -> Tuple[DictStrAny, ExtractorUsage]:
+    """Return a generated JSON schema and its usage, reusing earlier runs."""
+    # Prompt or model-generation changes in structx must invalidate old schemas
+    digest = hashlib.sha256(
+        f"{__version__}\0{source_digest()}\0{extractor.model_name}\0{query}\0".encode()
+    )
+    digest.update(data_path.read_bytes())
+    cache_path = SCHEMA_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+    if cache_path.is_file():
+        cached = from_json(cache_path.read_bytes())
+        usage = ExtractorUsage()
+        for step, calls in cached["usage"]["steps"].items():
+            for call in calls:
+                usage.add_step_usage(ExtractionStep(step), SimpleNamespace(**call))
+        return cached["schema"], usage
+
+    # Skips document conversion and the planning call on docs rebuilds
+    data_model = await extractor.get_schema_async(query=query, data=data_path)
+    schema = data_model.model_json_schema()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(
+        to_json({"schema": schema, "usage": data_model.usage}, fallback=str)
+    )
+    return schema, data_model.usage
 
 
 def print_section_header(title: str, description: Optional[str] = None):
     """Print a section header with an optional description."""
-    print(f"\n## {title}")
+    emit(f"\n## {title}")
     if description:
-        print(f"\n{description}")
+        emit(f"\n{description}")
 
 
-def print_code_block(code_lines: List[str]):
+def print_code_block(code: str):
     """Print code in a markdown code block."""
-    print("\n```python")
-    for line in code_lines:
-        print(line)
-    print("```")
+    emit("\n```python", code, "```")
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Build the typed serializer for a list of model instances once."""
+    return TypeAdapter(List[model])
+
 
+def print_json_schema(schema: DictStrAny):
+    """Print a JSON schema dict as a JSON code block."""
+    # Schemas are plain JSON data and need no fallback for unknown types
+    emit("\n```json", to_json(schema, indent=2), "```")
 
-def print_json(data: List[Dict]):
-    """Print data as a JSON code block."""
-    print("\n```json")
-    print(json.dumps(data, indent=2, default=str))
-    print("```")
+
+def print_json_records(records: List[BaseModel], model: Type[BaseModel]):
+    """Print extracted model instances as a JSON code block."""
+    emit("\n```json", list_adapter(model).dump_json(records, indent=2), "```")
 
 
 def print_token_usage(usage: ExtractorUsage):
     """Print token usage information."""
-    print("\n### Token Usage:")
+    emit("\n### Token Usage:")
     if usage:
-        print(f"Total tokens used: {usage.total_tokens}\n")
-        print("Tokens by step:\n")
+        emit(f"Total tokens used: {usage.total_tokens}\n", "Tokens by step:\n")
         for step, calls in usage.steps.items():
             tokens = sum(call.total_tokens for call in calls)
-            print(f"- {step.value}: {tokens} tokens\n")
+            emit(f"- {step.value}: {tokens} tokens\n")
 
 
 def print_extraction_results(results: ExtractionResult):
     """Print extraction results including stats, token usage, and data."""
-    print("\n### Results:")
-    print(
+    emit("\n### Results:")
+    emit(
         f"\nProcessed {results.success_count} rows with {results.success_rate:.1f}% success rate"
     )
 
@@ -55,64 +173,50 @@ def print_extraction_results(results: ExtractionResult):
 
     # Display results - either as markdown table or JSON
     if hasattr(results.data, "to_markdown"):
-        print(results.data.to_markdown(index=False))
+        emit(results.data.to_markdown(index=False))
     else:
-        print_json([item.model_dump() for item in results.data])
+        print_json_records(results.data, results.model)
 
 
-def run_extraction_example(
-    extractor: Extractor,
-    data_path: Path,
+async def run_extraction_example(
+    extraction: Awaitable[ExtractionResult],
     title: str,
     description: str,
-    query: str,
-    code_lines: List[str],
+    code: str,
 ) -> ExtractionResult:
-    """Run and document an extraction example."""
+    """Document an extraction example once its results are available."""
     print_section_header(title, description)
-    print_code_block(code_lines)
+    print_code_block(code)
 
-    results = extractor.extract(data=data_path, query=query)
+    results = await extraction
     print_extraction_results(results)
 
     # For complex examples that benefit from showing the model schema
     if (
         title != "Example 3: Complex Nested Extraction"
     ):  # Only show for simpler examples
-        print("\n<details>")
-        print(f"<summary>Generated Model: `{results.model.__name__}`</summary>\n")
-        print_json(results.model.model_json_schema())
-        print("\n</details>")
+        emit(
+            "\n<details>",
+            f"<summary>Generated Model: `{results.model.__name__}`</summary>\n",
+        )
+        print_json_schema(results.model.model_json_schema())
+        emit("\n</details>")
 
     return results
 
 
-def main():
-    # Redirect stdout to capture output
-    output = StringIO()
-    sys.stdout = output
-
+async def write_examples():
+    """Render the examples document into the page buffer."""
     # Start generating the README content
-    print("# Examples")
-    print(
+    emit("# Examples")
+    emit(
         "\nThis document contains examples of using the structx library for structured data extraction from unstructured documents."
     )
-    print(f"\n*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+    emit(f"\n*Generated on: {generated_at()}*")
 
     # Setup section
     print_section_header("Setup")
-    print_code_block(
-        [
-            "from structx import Extractor",
-            "from pathlib import Path",
-            "import os",
-            "\n# Initialize the extractor",
-            "extractor = Extractor.from_litellm(",
-            '    model="openai/gpt-4o",',
-            '    api_key="your-api-key"',
-            ")",
-        ]
-    )
+    print_code_block(SETUP_CODE)
 
     # Sample data section
     print_section_header(
@@ -125,50 +229,68 @@ def main():
     )
     invoice_path = Path("scripts/example_input/S0305SampleInvoice.pdf")
 
-    print(f"1. Consultancy Agreement: `{consultancy_agreement_path}`")
-    print(f"2. Invoice PDF: `{invoice_path}`")
+    emit(
+        f"1. Consultancy Agreement: `{consultancy_agreement_path}`",
+        f"2. Invoice PDF: `{invoice_path}`",
+    )
 
-    # Initialize extractor
+    # Initialize extractor; unchanged queries and documents hit the disk cache
+    enable_response_cache()
     extractor = Extractor.from_litellm(
         model="openai/gpt-4o",
         api_base=os.getenv("OPENAI_BASE_URL"),
     )
 
-    # Example 1: Extract Key Terms from a Legal Document
     q1 = "summarize the main terms and conditions of this consultancy agreement, focusing on the key obligations, deliverables, and payment terms."
-    run_extraction_example(
-        extractor=extractor,
-        data_path=consultancy_agreement_path,
+    q2 = "this is an invoice for professional services rendered, extract the professional name, service description, hourly rate and total amount."
+    q3 = "extract the confidentiality clause, including the definition of confidential information and the duration of the obligation."
+
+    # Run every model-backed example concurrently; sections still print in order
+    examples = [
+        asyncio.create_task(
+            extractor.extract_async(data=consultancy_agreement_path, query=q1)
+        ),
+        asyncio.create_task(extractor.extract_async(data=invoice_path, query=q2)),
+        asyncio.create_task(cached_schema(extractor, q3, consultancy_agreement_path)),
+    ]
+    try:
+        await asyncio.gather(*examples)
+    finally:
+        # A failed example stops the others instead of leaving paid calls running
+        for example in examples:
+            example.cancel()
+    example_1, example_2, example_3 = examples
+
+    # Example 1: Extract Key Terms from a Legal Document
+    await run_extraction_example(
+        example_1,
         title="Example 1: Extracting Key Terms from a Legal Agreement",
         description="This example demonstrates extracting key information from a DOCX file containing a consultancy agreement.",
-        query=q1,
-        code_lines=[
-            "# Define the path to the document",
-            f'agreement_path = Path("{consultancy_agreement_path}")',
-            "\n# Define the extraction query",
-            f'query = "{q1}"',
-            "result = extractor.extract(data=agreement_path, query=query)",
-            "\n# Access the extraction results",
-            'print(f"Processed {result.success_count} rows with {result.success_rate:.1f}% success rate")',
-            "print(result.data)",
-        ],
+        code=dedent(f"""\
+            # Define the path to the document
+            agreement_path = Path("{consultancy_agreement_path}")
+
+            # Define the extraction query
+            query = "{q1}"
+            result = extractor.extract(data=agreement_path, query=query)
+
+            # Access the extraction results
+            print(f"Processed {{result.success_count}} rows with {{result.success_rate:.1f}}% success rate")
+            print(result.data)"""),
     )
 
     # Example 2: Extract Details from an Invoice PDF
-    q2 = "this is an invoice for professional services rendered, extract the professional name, service description, hourly rate and total amount."
-    run_extraction_example(
-        extractor=extractor,
-        data_path=invoice_path,
+    await run_extraction_example(
+        example_2,
         title="Example 2: Extracting Details from an Invoice PDF",
         description="This example showcases extracting structured data from a PDF invoice, including line items.",
-        query=q2,
-        code_lines=[
-            "# Define the path to the PDF",
-            f'invoice_path = Path("{invoice_path}")',
-            "\n# Define the extraction query",
-            f'query = "{q2}"',
-            "result = extractor.extract(data=invoice_path, query=query)",
-        ],
+        code=dedent(f"""\
+            # Define the path to the PDF
+            invoice_path = Path("{invoice_path}")
+
+            # Define the extraction query
+            query = "{q2}"
+            result = extractor.extract(data=invoice_path, query=query)"""),
     )
 
     # Example 3: Schema Generation for Legal Clauses
@@ -177,36 +299,42 @@ def main():
         "This example shows how to generate and inspect a schema for extracting specific clauses from a legal document without performing a full extraction.",
     )
 
-    q3 = "extract the confidentiality clause, including the definition of confidential information and the duration of the obligation."
-    print_code_block(
-        [
-            "# Generate schema for a specific legal clause",
-            f'query = "{q3}"',
-            f'agreement_path = Path("{consultancy_agreement_path}")',
-            "DataModel = extractor.get_schema(query=query, data=agreement_path)",
-            "\n# Print schema",
-            "print(DataModel.model_json_schema())",
-        ]
-    )
+    print_code_block(dedent(f"""\
+            # Generate schema for a specific legal clause
+            query = "{q3}"
+            agreement_path = Path("{consultancy_agreement_path}")
+            DataModel = extractor.get_schema(query=query, data=agreement_path)
 
-    DataModel = extractor.get_schema(query=q3, data=consultancy_agreement_path)
+            # Print schema
+            print(DataModel.model_json_schema())"""))
 
-    print("\n### Token Usage for Schema Generation Process:")
+    schema, usage = await example_3
 
-    usage: ExtractorUsage = DataModel.usage
+    emit("\n### Token Usage for Schema Generation Process:")
 
     print_token_usage(usage)
-    print("\n<details>")
-    print("<summary>Generated Schema</summary>\n")
-    print_json(DataModel.model_json_schema())
-    print("\n</details>")
+    emit("\n<details>", "<summary>Generated Schema</summary>\n")
+    print_json_schema(schema)
+    emit("\n</details>")
 
-    # Restore stdout
-    sys.stdout = sys.__stdout__
 
-    # Write the captured output to README.md
-    Path("docs/examples.md").write_text(output.getvalue(), encoding="utf-8")
-    print(f"examples.md has been generated successfully!")
+def main(output_path: Path = Path("docs/examples.md")):
+    digest = inputs_digest()
+    if (
+        output_path.is_file()
+        and INPUTS_STAMP_PATH.is_file()
+        and INPUTS_STAMP_PATH.read_text() == digest
+    ):
+        print(f"{output_path.name} is up to date; inputs are unchanged.")
+        return
+
+    # The page is only written after every example has rendered
+    _OUT.clear()
+    asyncio.run(write_examples())
+    output_path.write_bytes(_OUT)
+    INPUTS_STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    INPUTS_STAMP_PATH.write_text(digest)
+    print(f"{output_path.name} has been generated successfully!")
 
 
 if __name__ == "__main__":
@@ -2,9 +2,10 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import pandas as pd
+from tabulate import tabulate
 
 
 @dataclass(frozen=True)
@@ -71,9 +72,35 @@ class PreparedInput:
     def row_payload(
         self, position: int, row: pd.Series, target_columns: List[str]
     ) -> RowPayload:
-        """Build the text or PDF payload for one positional input row."""
+        """Build the text or PDF payload for one positional input row.
+
+        Text payloads depend only on the row values, not its index label, so
+        identical rows produce identical payloads.
+        """
         self.ensure_open()
         pdf_row = self.pdf_rows.get(position)
         if pdf_row is not None:
             return pdf_row
-        return row[target_columns].to_markdown()
+        return _markdown_row(target_columns, row[target_columns].tolist())
+
+    def row_payloads(
+        self, start: int, stop: int, target_columns: List[str]
+    ) -> List[RowPayload]:
+        """Build payloads for positional rows ``start:stop`` in one pass.
+
+        Target columns are selected once for the whole range instead of
+        materializing a ``Series`` per row.
+        """
+        self.ensure_open()
+        rows = self.dataframe.iloc[start:stop][target_columns]
+        return [
+            self.pdf_rows.get(position) or _markdown_row(target_columns, values)
+            for position, values in enumerate(
+                rows.itertuples(index=False, name=None), start
+            )
+        ]
+
+
+def _markdown_row(columns: List[str], values: Sequence[Any]) -> str:
+    """Render one row as a two-column markdown table of column and value."""
+    return tabulate(list(zip(columns, values)), headers=["", "value"], tablefmt="pipe")
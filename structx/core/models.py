@@ -97,7 +97,11 @@ class RowResult(Generic[T]):
         input_data: Exact text or PDF payload sent for this row.
         items: Zero or more validated model instances returned for the row.
         usage: Provider usage recorded by this row's extraction request. It does
-            not include operation-level schema planning.
+            not include operation-level schema planning. A row whose payload
+            repeats an earlier row in the same operation reuses that row's
+            request and records no usage of its own. With ``rows_per_request``
+            above 1, a grouped request's usage is recorded on the first row it
+            served.
         error: Error text for a failed row, otherwise ``None``.
     """
 
@@ -176,7 +180,7 @@ class ExtractionResult(Generic[T]):
     @property
     def failure_count(self) -> int:
         """Number of input rows that failed extraction."""
-        return len(self.failed)
+        return sum(row.error is not None for row in self.rows)
 
     @property
     def success_rate(self) -> float:
@@ -194,7 +198,3 @@ class ExtractionResult(Generic[T]):
 
     def __str__(self):
         return self.__repr__()
-
-
-# Rebuild the model to ensure nested fields are properly defined
-ModelField.model_rebuild()
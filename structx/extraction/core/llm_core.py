@@ -14,7 +14,7 @@ from tenacity import (
     retry,
     retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from structx.core.config import ExtractionConfig
@@ -71,11 +71,15 @@ class LLMCore:
         self.max_wait = max_wait
         self.planning_model_name = planning_model_name or model_name
 
+        self._retry_settings: Optional[tuple[int, int, int]] = None
+        self._retrying_completions()
+
     def _create_retry_decorator(self):
         """Create retry decorator with instance parameters."""
         return retry(
             stop=stop_after_attempt(self.max_retries + 1),
-            wait=wait_exponential(
+            # Jittered waits keep concurrent rows from retrying in lockstep
+            wait=wait_random_exponential(
                 multiplier=self.min_wait, min=self.min_wait, max=self.max_wait
             ),
             retry=retry_if_exception(self._is_retryable_error),
@@ -84,6 +88,23 @@ class LLMCore:
             reraise=True,
         )
 
+    def _retrying_completions(self) -> tuple[Any, Any]:
+        """Return retry-wrapped completions for the current retry settings.
+
+        Wrappers are reused across calls (tenacity copies its retry state for
+        every call) and rebuilt when ``max_retries``, ``min_wait`` or
+        ``max_wait`` change.
+        """
+        settings = (self.max_retries, self.min_wait, self.max_wait)
+        if settings != self._retry_settings:
+            retry_decorator = self._create_retry_decorator()
+            self._complete_with_retries = retry_decorator(self._complete_once)
+            self._complete_with_retries_async = retry_decorator(
+                self._complete_once_async
+            )
+            self._retry_settings = settings
+        return self._complete_with_retries, self._complete_with_retries_async
+
     def _request_settings(self, step: ExtractionStep) -> tuple[str, Dict[str, Any]]:
         if step == ExtractionStep.EXTRACTION:
             return self.model_name, self.config.for_step("extraction")
@@ -219,13 +240,8 @@ class LLMCore:
         usage: Optional[ExtractorUsage] = None,
     ) -> ResponseType:
         """Perform a model-routed completion with transient-error retries."""
-        retry_decorator = self._create_retry_decorator()
-
-        @retry_decorator
-        def _complete():
-            return self._complete_once(messages, response_model, step, usage)
-
-        return _complete()
+        complete_with_retries, _ = self._retrying_completions()
+        return complete_with_retries(messages, response_model, step, usage)
 
     async def complete_async(
         self,
@@ -235,15 +251,10 @@ class LLMCore:
         usage: Optional[ExtractorUsage] = None,
     ) -> ResponseType:
         """Perform an asynchronous completion with transient-error retries."""
-        retry_decorator = self._create_retry_decorator()
-
-        @retry_decorator
-        async def _complete():
-            return await self._complete_once_async(
+        _, complete_with_retries_async = self._retrying_completions()
+        try:
+            return await complete_with_retries_async(
                 messages, response_model, step, usage
             )
-
-        try:
-            return await _complete()
         except Exception as error:
             raise ExtractionError(f"LLM completion failed: {error}") from error
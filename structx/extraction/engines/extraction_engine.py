@@ -7,11 +7,16 @@ from typing import Any, Dict, List, Optional, Type
 
 from instructor.processing.multimodal import PDF
 from loguru import logger
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, Field, create_model, model_validator
 
 from structx.core.input import PdfRow, RowPayload
 from structx.extraction.core.llm_core import LLMCore
-from structx.utils.prompts import extraction_system_prompt, extraction_template
+from structx.utils.prompts import (
+    extraction_system_prompt,
+    render_batch_extraction_text,
+    render_extraction_instructions,
+    render_extraction_text,
+)
 from structx.utils.usage import ExtractionStep, ExtractorUsage
 
 
@@ -41,6 +46,47 @@ class ExtractionEngine:
             ),
         )
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _batch_container_model(
+        extraction_model: Type[BaseModel], count: int
+    ) -> Type[BaseModel]:
+        name = extraction_model.__name__
+
+        def check_indices(self):
+            # Rejecting bad indices lets Instructor re-ask or fail the whole group
+            indices = sorted(row.index for row in self.rows)
+            if indices != list(range(count)):
+                raise ValueError(
+                    f"rows must contain each index from 0 to {count - 1} exactly "
+                    f"once, got {indices}"
+                )
+            return self
+
+        row_model = create_model(
+            f"{name}Row",
+            __base__=BaseModel,
+            index=(int, Field(description="Index of the text the items came from")),
+            items=(
+                List[extraction_model],
+                Field(description=f"List of {name} items from that text"),
+            ),
+        )
+        return create_model(
+            f"{name}BatchContainer",
+            __base__=BaseModel,
+            rows=(List[row_model], Field(description="One entry per input text")),
+            __validators__={
+                "check_indices": model_validator(mode="after")(check_indices)
+            },
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _system_prompt(instructions: str) -> str:
+        instructions_block = render_extraction_instructions(instructions)
+        return f"{extraction_system_prompt}\n\n{instructions_block}"
+
     @classmethod
     def _text_messages(
         cls,
@@ -49,16 +95,29 @@ class ExtractionEngine:
         instructions: str,
     ) -> List[Dict[str, Any]]:
         return [
-            {"role": "system", "content": extraction_system_prompt},
-            {
-                "role": "user",
-                "content": extraction_template.substitute(
-                    instructions=instructions,
-                    text=text,
-                ),
-            },
+            {"role": "system", "content": cls._system_prompt(instructions)},
+            {"role": "user", "content": render_extraction_text(text)},
         ]
 
+    @classmethod
+    def _batch_messages(
+        cls,
+        texts: List[str],
+        instructions: str,
+    ) -> List[Dict[str, Any]]:
+        return [
+            {"role": "system", "content": cls._system_prompt(instructions)},
+            {"role": "user", "content": render_batch_extraction_text(texts)},
+        ]
+
+    @staticmethod
+    def _items_per_text(container: BaseModel, count: int) -> List[List[BaseModel]]:
+        # The container validator guarantees one row per index
+        grouped: List[List[BaseModel]] = [[] for _ in range(count)]
+        for row in container.rows:
+            grouped[row.index] = row.items
+        return grouped
+
     @classmethod
     def _pdf_messages(
         cls,
@@ -67,11 +126,11 @@ class ExtractionEngine:
         instructions: str,
     ) -> List[Dict[str, Any]]:
         content = [
-            f"Extract structured information from this PDF.\n\n{instructions}\n\n",
+            "Extract structured information from this PDF.",
             PDF.from_path(pdf_path),
         ]
         return [
-            {"role": "system", "content": extraction_system_prompt},
+            {"role": "system", "content": cls._system_prompt(instructions)},
             {"role": "user", "content": content},
         ]
 
@@ -128,6 +187,58 @@ class ExtractionEngine:
         )
         return container.items
 
+    def extract_from_texts(
+        self,
+        texts: List[str],
+        extraction_model: Type[BaseModel],
+        instructions: str,
+        usage: Optional[ExtractorUsage] = None,
+    ) -> List[List[BaseModel]]:
+        """
+        Extract several texts with one request.
+
+        Args:
+            texts: Texts to extract from
+            extraction_model: Pydantic model for extraction
+            instructions: Explicit extraction instructions
+
+        Returns:
+            Extracted model instances for each text, in input order
+        """
+        if len(texts) == 1:
+            return [
+                self.extract_with_model(texts[0], extraction_model, instructions, usage)
+            ]
+        container = self.llm_core.complete(
+            messages=self._batch_messages(texts, instructions),
+            response_model=self._batch_container_model(extraction_model, len(texts)),
+            step=ExtractionStep.EXTRACTION,
+            usage=usage,
+        )
+        return self._items_per_text(container, len(texts))
+
+    async def extract_from_texts_async(
+        self,
+        texts: List[str],
+        extraction_model: Type[BaseModel],
+        instructions: str,
+        usage: Optional[ExtractorUsage] = None,
+    ) -> List[List[BaseModel]]:
+        """Asynchronously extract several texts with one request."""
+        if len(texts) == 1:
+            return [
+                await self.extract_with_model_async(
+                    texts[0], extraction_model, instructions, usage
+                )
+            ]
+        container = await self.llm_core.complete_async(
+            messages=self._batch_messages(texts, instructions),
+            response_model=self._batch_container_model(extraction_model, len(texts)),
+            step=ExtractionStep.EXTRACTION,
+            usage=usage,
+        )
+        return self._items_per_text(container, len(texts))
+
     def extract_with_multimodal_pdf(
         self,
         pdf_path: str,
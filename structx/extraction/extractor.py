@@ -1,11 +1,23 @@
 """Public orchestration for structured extraction operations."""
 
 import asyncio
+import threading
+from concurrent.futures import Future
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Type, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    Union,
+)
 
 from instructor import AsyncInstructor, Instructor
 from loguru import logger
@@ -13,11 +25,11 @@ from pydantic import BaseModel
 
 from structx.core.config import ExtractionConfig
 from structx.core.exceptions import ConfigurationError, ExtractionError
-from structx.core.input import PreparedInput, RowPayload
+from structx.core.input import PdfRow, PreparedInput, RowPayload
 from structx.core.models import ExtractionResult, RowResult
 from structx.extraction.core.llm_core import LLMCore
 from structx.extraction.engines.extraction_engine import ExtractionEngine
-from structx.extraction.processors.batch_processor import BatchProcessor
+from structx.extraction.processors.batch_processor import BatchProcessor, RowTask
 from structx.extraction.processors.content_analyzer import ContentAnalyzer
 from structx.extraction.processors.input_processor import InputData, InputProcessor
 from structx.extraction.processors.model_operations import ModelOperations
@@ -49,8 +61,12 @@ class Extractor:
         max_wait: Maximum seconds to wait between retries
         planning_model: Optional model for instruction and schema generation
         async_client: Optional async Instructor client for async methods
+        rows_per_request: Text rows extracted together in one provider request
     """
 
+    # Planning needs a representative span, not every character of long cells
+    SCHEMA_SAMPLE_MAX_CHARS: int = 2000
+
     def __init__(
         self,
         client: Instructor,
@@ -63,6 +79,7 @@ class Extractor:
         max_wait: int = 10,
         planning_model: Optional[str] = None,
         async_client: Optional[AsyncInstructor] = None,
+        rows_per_request: int = 1,
     ):
         """Initialize extractor."""
         if (
@@ -77,6 +94,12 @@ class Extractor:
             or batch_size < 1
         ):
             raise ConfigurationError("batch_size must be a positive integer")
+        if (
+            not isinstance(rows_per_request, int)
+            or isinstance(rows_per_request, bool)
+            or rows_per_request < 1
+        ):
+            raise ConfigurationError("rows_per_request must be a positive integer")
         if (
             not isinstance(max_retries, int)
             or isinstance(max_retries, bool)
@@ -89,6 +112,7 @@ class Extractor:
             )
 
         self.model_name = model_name
+        self.rows_per_request = rows_per_request
 
         # Setup configuration
         if config is None:
@@ -186,7 +210,7 @@ class Extractor:
         logger.debug(f"Extraction Instructions: {plan.instructions}")
         logger.debug(f"Target Columns: {plan.target_columns}")
 
-        extraction_model = self.model_operations.create_model_from_schema(
+        extraction_model = self.model_operations.cached_model_from_schema(
             plan.extraction_schema
         )
         return ExtractionStrategy(
@@ -222,7 +246,7 @@ class Extractor:
             usage=usage,
             pdf_path=self._planning_pdf_path(prepared_input),
         )
-        extraction_model = self.model_operations.create_model_from_schema(
+        extraction_model = self.model_operations.cached_model_from_schema(
             plan.extraction_schema
         )
         return ExtractionStrategy(
@@ -240,7 +264,11 @@ class Extractor:
                 prepared_input
             )
             return f"Content type: {content_context}\n\n{sample_text}"
-        return "\n".join(df.head().to_string(index=False).splitlines())
+        return "\n".join(
+            df.head()
+            .to_string(index=False, max_colwidth=self.SCHEMA_SAMPLE_MAX_CHARS)
+            .splitlines()
+        )
 
     @staticmethod
     def _planning_pdf_path(prepared_input: PreparedInput) -> Optional[str]:
@@ -254,7 +282,36 @@ class Extractor:
         self,
         strategy: ExtractionStrategy,
     ):
-        """Create a worker function for synchronous row extraction."""
+        """Create a worker function for synchronous row extraction.
+
+        Rows with identical payloads share one provider request per operation.
+        """
+        requests: Dict[RowPayload, Future] = {}
+        requests_lock = threading.Lock()
+
+        def extract_items(
+            row_data: RowPayload, usage: ExtractorUsage
+        ) -> List[BaseModel]:
+            with requests_lock:
+                request = requests.get(row_data)
+                is_owner = request is None
+                if is_owner:
+                    request = requests[row_data] = Future()
+            if not is_owner:
+                return [item.model_copy(deep=True) for item in request.result()]
+
+            try:
+                items = self.extraction_engine.extract_from_row_data(
+                    row_data=row_data,
+                    extraction_model=strategy.model,
+                    instructions=strategy.instructions,
+                    usage=usage,
+                )
+            except BaseException as error:
+                request.set_exception(error)
+                raise
+            request.set_result(items)
+            return items
 
         def extract_worker(
             row_data: RowPayload,
@@ -263,12 +320,7 @@ class Extractor:
         ):
             try:
                 row_usage = ExtractorUsage()
-                items = self.extraction_engine.extract_from_row_data(
-                    row_data=row_data,
-                    extraction_model=strategy.model,
-                    instructions=strategy.instructions,
-                    usage=row_usage,
-                )
+                items = extract_items(row_data, row_usage)
                 return RowResult(
                     position=row_position,
                     source_index=row_label,
@@ -292,7 +344,28 @@ class Extractor:
         self,
         strategy: ExtractionStrategy,
     ):
-        """Create an async worker that preserves row identity on success or failure."""
+        """Create an async worker that preserves row identity on success or failure.
+
+        Rows with identical payloads share one provider request per operation.
+        """
+        requests: Dict[RowPayload, asyncio.Future] = {}
+
+        async def extract_items(
+            row_data: RowPayload, usage: ExtractorUsage
+        ) -> List[BaseModel]:
+            request = requests.get(row_data)
+            if request is not None:
+                return [item.model_copy(deep=True) for item in await request]
+
+            request = requests[row_data] = asyncio.ensure_future(
+                self.extraction_engine.extract_from_row_data_async(
+                    row_data=row_data,
+                    extraction_model=strategy.model,
+                    instructions=strategy.instructions,
+                    usage=usage,
+                )
+            )
+            return await request
 
         async def extract_worker(
             row_data: RowPayload,
@@ -301,12 +374,7 @@ class Extractor:
         ) -> RowResult:
             try:
                 row_usage = ExtractorUsage()
-                items = await self.extraction_engine.extract_from_row_data_async(
-                    row_data=row_data,
-                    extraction_model=strategy.model,
-                    instructions=strategy.instructions,
-                    usage=row_usage,
-                )
+                items = await extract_items(row_data, row_usage)
                 return RowResult(
                     position=row_position,
                     source_index=row_label,
@@ -326,6 +394,172 @@ class Extractor:
 
         return extract_worker
 
+    @staticmethod
+    def _group_results(
+        tasks: List[RowTask],
+        requests: Mapping[RowPayload, Any],
+        owned: List[RowPayload],
+        usage: ExtractorUsage,
+    ) -> List[RowResult]:
+        """Build row results for a group whose requests have all completed.
+
+        The group's usage is recorded on the first row it issued a request for.
+        Rows served by a request owned elsewhere receive copies of its items.
+        """
+        first_use = set(owned)
+        usage_row = next(
+            (position for payload, position, _ in tasks if payload in first_use),
+            None,
+        )
+        results = []
+        for payload, position, label in tasks:
+            is_owner = payload in first_use
+            first_use.discard(payload)
+            row_usage = usage if position == usage_row else ExtractorUsage()
+            try:
+                items = requests[payload].result()
+            except Exception as error:
+                results.append(
+                    RowResult(
+                        position=position,
+                        source_index=label,
+                        input_data=payload,
+                        items=[],
+                        usage=row_usage,
+                        error=str(error),
+                    )
+                )
+                continue
+            if not is_owner:
+                items = [item.model_copy(deep=True) for item in items]
+            results.append(
+                RowResult(
+                    position=position,
+                    source_index=label,
+                    input_data=payload,
+                    items=items,
+                    usage=row_usage,
+                )
+            )
+        return results
+
+    def _create_group_extraction_worker(
+        self,
+        strategy: ExtractionStrategy,
+    ):
+        """Create a worker that extracts a group of text rows with one request.
+
+        PDF rows arrive in groups of their own and use one request each. Rows
+        with identical payloads share one provider request per operation.
+        """
+        requests: Dict[RowPayload, Future] = {}
+        requests_lock = threading.Lock()
+
+        def resolve(payloads: List[RowPayload], extract) -> None:
+            try:
+                extracted = extract()
+            except Exception as error:
+                for payload in payloads:
+                    requests[payload].set_exception(error)
+                return
+            for payload, items in zip(payloads, extracted):
+                requests[payload].set_result(items)
+
+        def extract_pdf(pdf_row: PdfRow, usage: ExtractorUsage):
+            return [
+                self.extraction_engine.extract_from_row_data(
+                    pdf_row, strategy.model, strategy.instructions, usage
+                )
+            ]
+
+        def extract_group(tasks: List[RowTask]) -> List[RowResult]:
+            usage = ExtractorUsage()
+            owned = []
+            with requests_lock:
+                for payload, _, _ in tasks:
+                    if payload not in requests:
+                        requests[payload] = Future()
+                        owned.append(payload)
+            texts = [payload for payload in owned if not isinstance(payload, PdfRow)]
+            try:
+                if texts:
+                    resolve(
+                        texts,
+                        partial(
+                            self.extraction_engine.extract_from_texts,
+                            texts,
+                            strategy.model,
+                            strategy.instructions,
+                            usage,
+                        ),
+                    )
+                for pdf_row in owned:
+                    if isinstance(pdf_row, PdfRow):
+                        resolve([pdf_row], partial(extract_pdf, pdf_row, usage))
+            finally:
+                # Never leave rows in other groups waiting on an interrupted group
+                for payload in owned:
+                    requests[payload].cancel()
+            return self._group_results(tasks, requests, owned, usage)
+
+        return extract_group
+
+    def _create_async_group_extraction_worker(
+        self,
+        strategy: ExtractionStrategy,
+    ):
+        """Create an async worker that extracts a group of text rows at once."""
+        requests: Dict[RowPayload, asyncio.Future] = {}
+
+        async def resolve(payloads: List[RowPayload], extract) -> None:
+            try:
+                extracted = await extract()
+            except Exception as error:
+                for payload in payloads:
+                    requests[payload].set_exception(error)
+                return
+            for payload, items in zip(payloads, extracted):
+                requests[payload].set_result(items)
+
+        async def extract_pdf(pdf_row: PdfRow, usage: ExtractorUsage):
+            return [
+                await self.extraction_engine.extract_from_row_data_async(
+                    pdf_row, strategy.model, strategy.instructions, usage
+                )
+            ]
+
+        async def extract_group(tasks: List[RowTask]) -> List[RowResult]:
+            usage = ExtractorUsage()
+            loop = asyncio.get_running_loop()
+            owned = []
+            for payload, _, _ in tasks:
+                if payload not in requests:
+                    requests[payload] = loop.create_future()
+                    owned.append(payload)
+            texts = [payload for payload in owned if not isinstance(payload, PdfRow)]
+            try:
+                if texts:
+                    await resolve(
+                        texts,
+                        partial(
+                            self.extraction_engine.extract_from_texts_async,
+                            texts,
+                            strategy.model,
+                            strategy.instructions,
+                            usage,
+                        ),
+                    )
+                for pdf_row in owned:
+                    if isinstance(pdf_row, PdfRow):
+                        await resolve([pdf_row], partial(extract_pdf, pdf_row, usage))
+            finally:
+                for payload in owned:
+                    requests[payload].cancel()
+            await asyncio.wait({requests[payload] for payload, _, _ in tasks})
+            return self._group_results(tasks, requests, owned, usage)
+
+        return extract_group
+
     def _process_data(
         self,
         prepared_input: PreparedInput,
@@ -347,12 +581,20 @@ class Extractor:
             expand_nested=expand_nested,
         )
 
-        worker_fn = self._create_extraction_worker(strategy=strategy)
-
         # Process in batches
-        outcomes = self.batch_processor.map_rows(
-            prepared_input, worker_fn, strategy.target_columns
-        )
+        if self.rows_per_request > 1:
+            outcomes = self.batch_processor.map_row_groups(
+                prepared_input,
+                self._create_group_extraction_worker(strategy),
+                strategy.target_columns,
+                self.rows_per_request,
+            )
+        else:
+            outcomes = self.batch_processor.map_rows(
+                prepared_input,
+                self._create_extraction_worker(strategy=strategy),
+                strategy.target_columns,
+            )
         for outcome in outcomes:
             operation_usage.merge(outcome.usage)
             results.record(outcome)
@@ -365,6 +607,7 @@ class Extractor:
         return_df: bool,
         expand_nested: bool = False,
         extraction_model: Optional[Type[BaseModel]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> ExtractionResult:
         """Plan once, then asynchronously process independent rows."""
         if self.llm_core.async_client is None:
@@ -381,11 +624,21 @@ class Extractor:
             return_df=return_df,
             expand_nested=expand_nested,
         )
-        outcomes = await self.batch_processor.map_rows_async(
-            prepared_input,
-            self._create_async_extraction_worker(strategy),
-            strategy.target_columns,
-        )
+        if self.rows_per_request > 1:
+            outcomes = await self.batch_processor.map_row_groups_async(
+                prepared_input,
+                self._create_async_group_extraction_worker(strategy),
+                strategy.target_columns,
+                self.rows_per_request,
+                semaphore=semaphore,
+            )
+        else:
+            outcomes = await self.batch_processor.map_rows_async(
+                prepared_input,
+                self._create_async_extraction_worker(strategy),
+                strategy.target_columns,
+                semaphore=semaphore,
+            )
         for outcome in outcomes:
             operation_usage.merge(outcome.usage)
             results.record(outcome)
@@ -520,15 +773,30 @@ class Extractor:
             async with self.input_processor.prepared_async(
                 data, **kwargs
             ) as prepared_input:
-                results = {}
-                for query in queries:
-                    results[query] = await self._process_data_async(
-                        prepared_input=prepared_input,
-                        query=query,
-                        return_df=return_df,
-                        expand_nested=expand_nested,
+                # One semaphore keeps row requests within max_threads across
+                # all concurrently running queries.
+                semaphore = asyncio.Semaphore(self.batch_processor.max_threads)
+                tasks = [
+                    asyncio.create_task(
+                        self._process_data_async(
+                            prepared_input=prepared_input,
+                            query=query,
+                            return_df=return_df,
+                            expand_nested=expand_nested,
+                            semaphore=semaphore,
+                        )
                     )
-                return results
+                    for query in queries
+                ]
+                try:
+                    outcomes = await asyncio.gather(*tasks)
+                finally:
+                    pending = [task for task in tasks if not task.done()]
+                    for task in pending:
+                        task.cancel()
+                    if pending:
+                        await asyncio.gather(*pending, return_exceptions=True)
+                return dict(zip(queries, outcomes))
         except Exception as error:
             raise ExtractionError(f"Async batch extraction failed: {error}") from error
 
@@ -566,6 +834,7 @@ class Extractor:
                 pdf_path=pdf_path,
             )
 
+            # A fresh model per call, since usage is attached to the class
             extraction_model = self.model_operations.create_model_from_schema(
                 plan.extraction_schema
             )
@@ -683,6 +952,7 @@ class Extractor:
         min_wait: int = 1,
         max_wait: int = 10,
         planning_model: Optional[str] = None,
+        rows_per_request: int = 1,
         **litellm_kwargs: Any,
     ) -> "Extractor":
         """
@@ -698,6 +968,7 @@ class Extractor:
             min_wait: Minimum seconds to wait between retries
             max_wait: Maximum seconds to wait between retries
             planning_model: Optional model for instruction and schema generation
+            rows_per_request: Text rows extracted together in one provider request
             **litellm_kwargs: Additional kwargs for litellm (e.g., api_base, organization)
         """
         import instructor
@@ -724,4 +995,5 @@ class Extractor:
             min_wait=min_wait,
             max_wait=max_wait,
             planning_model=planning_model,
+            rows_per_request=rows_per_request,
         )
@@ -2,14 +2,17 @@
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Awaitable, Callable, List
+from typing import Any, Awaitable, Callable, List, Optional
 
 from tqdm import tqdm
 
-from structx.core.input import PreparedInput, RowPayload
+from structx.core.input import PdfRow, PreparedInput, RowPayload
 
+RowTask = tuple[RowPayload, int, Any]
 RowWorker = Callable[[RowPayload, int, Any], Any]
 AsyncRowWorker = Callable[[RowPayload, int, Any], Awaitable[Any]]
+GroupWorker = Callable[[List[RowTask]], List[Any]]
+AsyncGroupWorker = Callable[[List[RowTask]], Awaitable[List[Any]]]
 
 
 class BatchProcessor:
@@ -38,15 +41,43 @@ class BatchProcessor:
         target_columns: List[str],
     ) -> List[Any]:
         """Process all rows in stable input order and bounded batches."""
+
+        def each_row(tasks: List[RowTask]) -> List[Any]:
+            return [worker(*task) for task in tasks]
+
+        return self.map_row_groups(prepared_input, each_row, target_columns, 1)
+
+    def map_row_groups(
+        self,
+        prepared_input: PreparedInput,
+        worker: GroupWorker,
+        target_columns: List[str],
+        group_size: int,
+    ) -> List[Any]:
+        """Process consecutive groups of rows, returning one result per row.
+
+        The worker receives up to ``group_size`` text row tasks and returns
+        their results in the same order. PDF rows always arrive in a group of
+        their own, so they still run concurrently. One worker pool serves every
+        batch of the operation, so worker threads are started once rather than
+        once per batch.
+        """
         results: List[Any] = []
         dataframe = prepared_input.dataframe
-        for batch_start in range(0, len(dataframe), self.batch_size):
-            batch = dataframe.iloc[batch_start : batch_start + self.batch_size]
-            results.extend(
-                self._map_batch(
-                    prepared_input, batch_start, len(batch), worker, target_columns
+        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+            for batch_start in range(0, len(dataframe), self.batch_size):
+                batch = dataframe.iloc[batch_start : batch_start + self.batch_size]
+                results.extend(
+                    self._map_batch(
+                        executor,
+                        prepared_input,
+                        batch_start,
+                        len(batch),
+                        worker,
+                        target_columns,
+                        group_size,
+                    )
                 )
-            )
         return results
 
     async def map_rows_async(
@@ -54,10 +85,32 @@ class BatchProcessor:
         prepared_input: PreparedInput,
         worker: AsyncRowWorker,
         target_columns: List[str],
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> List[Any]:
-        """Asynchronously process rows with stable ordering and bounded concurrency."""
+        """Asynchronously process rows with stable ordering and bounded concurrency.
+
+        Pass a shared ``semaphore`` to bound row requests across several
+        concurrent operations instead of per operation.
+        """
+
+        async def each_row(tasks: List[RowTask]) -> List[Any]:
+            return [await worker(*task) for task in tasks]
+
+        return await self.map_row_groups_async(
+            prepared_input, each_row, target_columns, 1, semaphore=semaphore
+        )
+
+    async def map_row_groups_async(
+        self,
+        prepared_input: PreparedInput,
+        worker: AsyncGroupWorker,
+        target_columns: List[str],
+        group_size: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[Any]:
+        """Asynchronously process consecutive groups of rows in stable order."""
         results: List[Any] = []
-        semaphore = asyncio.Semaphore(self.max_threads)
+        semaphore = semaphore or asyncio.Semaphore(self.max_threads)
         dataframe = prepared_input.dataframe
         for batch_start in range(0, len(dataframe), self.batch_size):
             batch_length = len(
@@ -70,6 +123,7 @@ class BatchProcessor:
                     batch_length,
                     worker,
                     target_columns,
+                    group_size,
                     semaphore,
                 )
             )
@@ -80,41 +134,31 @@ class BatchProcessor:
         prepared_input: PreparedInput,
         start_position: int,
         batch_length: int,
-        worker: AsyncRowWorker,
+        worker: AsyncGroupWorker,
         target_columns: List[str],
+        group_size: int,
         semaphore: asyncio.Semaphore,
     ) -> List[Any]:
-        batch = prepared_input.dataframe.iloc[
-            start_position : start_position + batch_length
-        ]
-        row_tasks = [
-            (
-                prepared_input.row_payload(
-                    start_position + offset, row, target_columns
-                ),
-                start_position + offset,
-                label,
-            )
-            for offset, (label, row) in enumerate(batch.iterrows())
-        ]
+        groups = self._row_groups(
+            prepared_input, start_position, batch_length, target_columns, group_size
+        )
 
-        async def run(index: int, task: tuple[RowPayload, int, Any]):
+        async def run(index: int, group: List[RowTask]):
             async with semaphore:
-                return index, await worker(*task)
+                return index, await worker(group)
 
         tasks = [
-            asyncio.create_task(run(index, task))
-            for index, task in enumerate(row_tasks)
+            asyncio.create_task(run(index, group)) for index, group in enumerate(groups)
         ]
-        ordered: List[Any] = [None] * len(tasks)
+        ordered: List[List[Any]] = [[] for _ in tasks]
         try:
             with tqdm(
-                total=len(tasks), desc="Processing batch", unit="row"
+                total=batch_length, desc="Processing batch", unit="row"
             ) as progress:
                 for completed in asyncio.as_completed(tasks):
-                    index, result = await completed
-                    ordered[index] = result
-                    progress.update(1)
+                    index, group_results = await completed
+                    ordered[index] = group_results
+                    progress.update(len(group_results))
         finally:
             pending = []
             for task in tasks:
@@ -123,37 +167,73 @@ class BatchProcessor:
                     pending.append(task)
             if pending:
                 await asyncio.gather(*pending, return_exceptions=True)
+        return self._in_row_order(groups, ordered, start_position, batch_length)
+
+    @staticmethod
+    def _row_groups(
+        prepared_input: PreparedInput,
+        start_position: int,
+        batch_length: int,
+        target_columns: List[str],
+        group_size: int,
+    ) -> List[List[RowTask]]:
+        stop_position = start_position + batch_length
+        payloads = prepared_input.row_payloads(
+            start_position, stop_position, target_columns
+        )
+        labels = prepared_input.dataframe.index[start_position:stop_position]
+        groups: List[List[RowTask]] = []
+        text_group: List[RowTask] = []
+        for offset, (payload, label) in enumerate(zip(payloads, labels)):
+            task = (payload, start_position + offset, label)
+            if isinstance(payload, PdfRow):
+                # PDF rows are never combined, so each runs as its own task
+                groups.append([task])
+                continue
+            text_group.append(task)
+            if len(text_group) == group_size:
+                groups.append(text_group)
+                text_group = []
+        if text_group:
+            groups.append(text_group)
+        return groups
+
+    @staticmethod
+    def _in_row_order(
+        groups: List[List[RowTask]],
+        group_results: List[List[Any]],
+        start_position: int,
+        batch_length: int,
+    ) -> List[Any]:
+        ordered: List[Any] = [None] * batch_length
+        for group, results in zip(groups, group_results):
+            for (_, position, _), result in zip(group, results):
+                ordered[position - start_position] = result
         return ordered
 
     def _map_batch(
         self,
+        executor: ThreadPoolExecutor,
         prepared_input: PreparedInput,
         start_position: int,
         batch_length: int,
-        worker: RowWorker,
+        worker: GroupWorker,
         target_columns: List[str],
+        group_size: int,
     ) -> List[Any]:
-        batch = prepared_input.dataframe.iloc[
-            start_position : start_position + batch_length
-        ]
-        tasks = [
-            (
-                prepared_input.row_payload(
-                    start_position + offset, row, target_columns
-                ),
-                start_position + offset,
-                label,
-            )
-            for offset, (label, row) in enumerate(batch.iterrows())
-        ]
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            futures = [executor.submit(worker, *task) for task in tasks]
-            return [
-                future.result()
-                for future in tqdm(
-                    futures,
-                    desc="Processing batch",
-                    unit="row",
-                    total=len(futures),
-                )
-            ]
+        groups = self._row_groups(
+            prepared_input, start_position, batch_length, target_columns, group_size
+        )
+        futures = [executor.submit(worker, group) for group in groups]
+        group_results: List[List[Any]] = []
+        try:
+            with tqdm(
+                total=batch_length, desc="Processing batch", unit="row"
+            ) as progress:
+                for future in futures:
+                    group_results.append(future.result())
+                    progress.update(len(group_results[-1]))
+        finally:
+            for future in futures:
+                future.cancel()
+        return self._in_row_order(groups, group_results, start_position, batch_length)
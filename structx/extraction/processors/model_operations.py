@@ -2,8 +2,9 @@
 Model operations including schema generation and custom model processing.
 """
 
-import json
-from typing import Any, List, Optional, Tuple, Type
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple, Type
 
 from instructor.processing.multimodal import PDF
 from loguru import logger
@@ -12,11 +13,12 @@ from pydantic import BaseModel
 from structx.core.models import ExtractionPlan, ExtractionRequest
 from structx.extraction.core.llm_core import LLMCore
 from structx.extraction.generator import ModelGenerator
+from structx.utils.helpers import model_schema_json
 from structx.utils.prompts import (
     extraction_plan_system_prompt,
-    extraction_plan_template,
     refinement_system_prompt,
-    refinement_template,
+    render_extraction_plan,
+    render_refinement,
 )
 from structx.utils.usage import ExtractionStep, ExtractorUsage
 
@@ -24,8 +26,17 @@ from structx.utils.usage import ExtractionStep, ExtractorUsage
 class ModelOperations:
     """
     Handles all model-related operations including schema generation and custom model processing.
+
+    Plans for text samples are memoized per instance, so repeating a query over
+    identical data reuses the earlier plan instead of calling the model again.
+    ``cached_model_from_schema`` reuses models generated from identical schemas
+    the same way, which also keeps per-model caches such as the extraction
+    container warm.
     """
 
+    PLAN_CACHE_SIZE: int = 128
+    MODEL_CACHE_SIZE: int = 128
+
     def __init__(self, llm_core: LLMCore):
         """
         Initialize model operations.
@@ -34,6 +45,10 @@ class ModelOperations:
             llm_core: LLM core for completions
         """
         self.llm_core = llm_core
+        self._plans: OrderedDict[Hashable, ExtractionPlan] = OrderedDict()
+        self._plans_lock = threading.Lock()
+        self._models: OrderedDict[str, Type[BaseModel]] = OrderedDict()
+        self._models_lock = threading.Lock()
 
     @staticmethod
     def _validate_target_columns(
@@ -52,6 +67,11 @@ class ModelOperations:
         pdf_path: Optional[str] = None,
     ) -> ExtractionPlan:
         """Generate instructions, target columns, and schema in one model call."""
+        plan_key = self._plan_key(query, sample_text, data_columns, pdf_path)
+        cached_plan = self._cached_plan(plan_key)
+        if cached_plan is not None:
+            return cached_plan
+
         messages = self._plan_messages(query, sample_text, data_columns, pdf_path)
         plan = self.llm_core.complete(
             messages=messages,
@@ -59,7 +79,7 @@ class ModelOperations:
             step=ExtractionStep.SCHEMA_GENERATION,
             usage=usage,
         )
-        return self._finalize_plan(plan, data_columns)
+        return self._store_plan(plan_key, self._finalize_plan(plan, data_columns))
 
     async def generate_extraction_plan_async(
         self,
@@ -70,6 +90,11 @@ class ModelOperations:
         pdf_path: Optional[str] = None,
     ) -> ExtractionPlan:
         """Asynchronously generate instructions, target columns, and schema."""
+        plan_key = self._plan_key(query, sample_text, data_columns, pdf_path)
+        cached_plan = self._cached_plan(plan_key)
+        if cached_plan is not None:
+            return cached_plan
+
         messages = self._plan_messages(query, sample_text, data_columns, pdf_path)
         plan = await self.llm_core.complete_async(
             messages=messages,
@@ -77,7 +102,40 @@ class ModelOperations:
             step=ExtractionStep.SCHEMA_GENERATION,
             usage=usage,
         )
-        return self._finalize_plan(plan, data_columns)
+        return self._store_plan(plan_key, self._finalize_plan(plan, data_columns))
+
+    @staticmethod
+    def _plan_key(
+        query: str,
+        sample_text: str,
+        data_columns: List[str],
+        pdf_path: Optional[str],
+    ) -> Optional[Hashable]:
+        # A PDF path says nothing about the file's current contents
+        if pdf_path:
+            return None
+        return query, sample_text, tuple(data_columns)
+
+    def _cached_plan(self, plan_key: Optional[Hashable]) -> Optional[ExtractionPlan]:
+        if plan_key is None:
+            return None
+        with self._plans_lock:
+            plan = self._plans.get(plan_key)
+            if plan is None:
+                return None
+            self._plans.move_to_end(plan_key)
+        return plan.model_copy(deep=True)
+
+    def _store_plan(
+        self, plan_key: Optional[Hashable], plan: ExtractionPlan
+    ) -> ExtractionPlan:
+        if plan_key is not None:
+            with self._plans_lock:
+                self._plans[plan_key] = plan.model_copy(deep=True)
+                self._plans.move_to_end(plan_key)
+                while len(self._plans) > self.PLAN_CACHE_SIZE:
+                    self._plans.popitem(last=False)
+        return plan
 
     @staticmethod
     def _plan_messages(
@@ -86,7 +144,7 @@ class ModelOperations:
         data_columns: List[str],
         pdf_path: Optional[str],
     ) -> List[dict[str, Any]]:
-        prompt = extraction_plan_template.substitute(
+        prompt = render_extraction_plan(
             query=query,
             available_columns=data_columns,
             sample_text=sample_text or "See the attached PDF document.",
@@ -119,8 +177,38 @@ class ModelOperations:
             Generated Pydantic model class
         """
         extraction_model = ModelGenerator.from_extraction_request(schema_request)
-        logger.debug("Generated Model Schema:")
-        logger.debug(json.dumps(extraction_model.model_json_schema(), indent=2))
+        logger.opt(lazy=True).debug(
+            "Generated Model Schema:\n{}", lambda: model_schema_json(extraction_model)
+        )
+        return extraction_model
+
+    def cached_model_from_schema(
+        self, schema_request: ExtractionRequest
+    ) -> Type[BaseModel]:
+        """
+        Return the model for an extraction request, reusing identical schemas.
+
+        Cached models are shared between operations, so callers must not
+        attach per-call state such as ``usage`` to them.
+
+        Args:
+            schema_request: Request containing model schema
+
+        Returns:
+            Generated Pydantic model class
+        """
+        model_key = schema_request.model_dump_json()
+        with self._models_lock:
+            extraction_model = self._models.get(model_key)
+            if extraction_model is not None:
+                self._models.move_to_end(model_key)
+                return extraction_model
+
+        extraction_model = self.create_model_from_schema(schema_request)
+        with self._models_lock:
+            extraction_model = self._models.setdefault(model_key, extraction_model)
+            while len(self._models) > self.MODEL_CACHE_SIZE:
+                self._models.popitem(last=False)
         return extraction_model
 
     def refine_existing_model(
@@ -174,12 +262,12 @@ class ModelOperations:
     def _refinement_messages(
         model: Type[BaseModel], instructions: str
     ) -> List[dict[str, Any]]:
-        model_schema = json.dumps(model.model_json_schema(), indent=2)
+        model_schema = model_schema_json(model)
         return [
             {"role": "system", "content": refinement_system_prompt},
             {
                 "role": "user",
-                "content": refinement_template.substitute(
+                "content": render_refinement(
                     model_schema=model_schema,
                     instructions=instructions,
                 ),
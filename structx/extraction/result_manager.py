@@ -1,18 +1,23 @@
 """Operation-scoped collection of row extraction results."""
 
-from typing import List, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 from pydantic import BaseModel
 
 from structx.core.models import ExtractionResult, RowResult
-from structx.utils.helpers import flatten_extracted_data
+from structx.utils.helpers import flatten_extracted_data, model_row_data
 from structx.utils.usage import ExtractorUsage
 
 
 class ResultCollector:
-    """Own mutable result state for exactly one extraction operation."""
+    """Own mutable result state for exactly one extraction operation.
+
+    DataFrame output is accumulated in one object array per result column and
+    joined onto a copy of the source only when the result is built.
+    """
 
     def __init__(
         self,
@@ -24,15 +29,27 @@ class ResultCollector:
         self.model = model
         self.return_df = return_df
         self.expand_nested = expand_nested
+        self.source = source
         self.total_rows = len(source)
-        self.result_df: Optional[pd.DataFrame] = source.copy() if return_df else None
+        self.columns: Optional[Dict[str, np.ndarray]] = None
         self.items: List[BaseModel] = []
         self.rows: List[RowResult[BaseModel]] = []
 
-        if self.result_df is not None:
+        if return_df:
+            self.columns = {}
             for field_name in model.model_fields:
-                self.result_df[field_name] = None
-            self.result_df["extraction_status"] = None
+                self._column(field_name)
+            self._column("extraction_status")
+
+    def _column(self, name: str) -> np.ndarray:
+        assert self.columns is not None
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = np.full(self.total_rows, None, dtype=object)
+        return column
+
+    def _set(self, name: str, position: int, value: Any) -> None:
+        self._column(name)[position] = value
 
     def record(self, outcome: RowResult[BaseModel]) -> None:
         """Record one row outcome in its original input position."""
@@ -45,13 +62,10 @@ class ResultCollector:
             self.items.extend(outcome.items)
 
     def _record_dataframe_items(self, outcome: RowResult[BaseModel]) -> None:
-        assert self.result_df is not None
         for item_index, item in enumerate(outcome.items):
-            item_data = (
-                flatten_extracted_data(item.model_dump())
-                if self.expand_nested
-                else item.model_dump()
-            )
+            item_data = model_row_data(item)
+            if self.expand_nested:
+                item_data = flatten_extracted_data(item_data)
             if item_index > 0:
                 item_data = {
                     f"{field_name}_{item_index}": value
@@ -59,22 +73,25 @@ class ResultCollector:
                 }
 
             for field_name, value in item_data.items():
-                if field_name not in self.result_df.columns:
-                    self.result_df[field_name] = None
-                column_position = self.result_df.columns.get_loc(field_name)
-                self.result_df.iat[outcome.position, column_position] = value
-
-        status_position = self.result_df.columns.get_loc("extraction_status")
-        self.result_df.iat[outcome.position, status_position] = (
-            "Success" if outcome.items else "Empty"
+                self._set(field_name, outcome.position, value)
+
+        self._set(
+            "extraction_status",
+            outcome.position,
+            "Success" if outcome.items else "Empty",
         )
 
     def _record_failure(self, outcome: RowResult[BaseModel]) -> None:
-        if self.result_df is not None:
-            status_position = self.result_df.columns.get_loc("extraction_status")
-            self.result_df.iat[outcome.position, status_position] = (
-                f"Failed: {outcome.error}"
-            )
+        if self.columns is not None:
+            self._set("extraction_status", outcome.position, f"Failed: {outcome.error}")
+
+    def _build_dataframe(self) -> pd.DataFrame:
+        assert self.columns is not None
+        result_df = self.source.copy()
+        for name, values in self.columns.items():
+            # Keep object columns so empty cells stay None
+            result_df[name] = pd.Series(values, index=result_df.index, dtype=object)
+        return result_df
 
     def build(self, usage: ExtractorUsage) -> ExtractionResult:
         """Finalize the public result and log row-level statistics."""
@@ -87,7 +104,7 @@ class ResultCollector:
             self.total_rows,
         )
         return ExtractionResult(
-            data=self.result_df if self.return_df else self.items,
+            data=self._build_dataframe() if self.return_df else self.items,
             rows=self.rows,
             model=self.model,
             usage=usage,
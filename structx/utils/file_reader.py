@@ -1,4 +1,5 @@
 import tempfile
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 from urllib.parse import unquote, urlparse
@@ -25,6 +26,7 @@ class FileReader:
         ".xlsx": pd.read_excel,
         ".xls": pd.read_excel,
         ".json": pd.read_json,
+        ".jsonl": partial(pd.read_json, lines=True),
         ".parquet": pd.read_parquet,
         ".feather": pd.read_feather,
     }
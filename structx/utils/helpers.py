@@ -1,12 +1,15 @@
 import json
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict, Type
 
 from loguru import logger
+from pydantic import BaseModel
 
 from structx.core.exceptions import ExtractionError
 from structx.utils.types import P, R
 
+_CONTAINER_TYPES = (BaseModel, dict, list, tuple, set, frozenset)
+
 
 def handle_errors(
     error_message: str,
@@ -21,34 +24,90 @@ def handle_errors(
             try:
                 return func(*args, **kwargs)
             except Exception as error:
-                logger.error(
-                    f"{error_message}: {str(error)}\nFunction: {func.__name__}"
-                )
+                message = f"{error_message}: {error}"
+                logger.error(f"{message}\nFunction: {func.__name__}")
                 if default_return is not None:
                     return default_return
-                raise error_type(f"{error_message}: {str(error)}") from error
+                raise error_type(message) from error
 
         return wrapper
 
     return decorator
 
 
+@lru_cache(maxsize=128)
+def model_schema_json(model: Type[BaseModel]) -> str:
+    """Return a model's indented JSON schema, generated once per model class."""
+    return json.dumps(model.model_json_schema(), indent=2)
+
+
+def _has_serializer(schema: Any) -> bool:
+    """Whether a core schema or any schema nested in it serializes specially."""
+    if isinstance(schema, dict):
+        return "serialization" in schema or any(
+            _has_serializer(value) for value in schema.values()
+        )
+    if isinstance(schema, (list, tuple)):
+        return any(_has_serializer(value) for value in schema)
+    return False
+
+
+@lru_cache(maxsize=128)
+def _dumps_as_attributes(model: Type[BaseModel]) -> bool:
+    """Whether a model's dump is its attributes when every value is a scalar."""
+    decorators = model.__pydantic_decorators__
+    return not (
+        model.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or model.model_config.get("extra") == "allow"
+        or model.model_config.get("serialize_by_alias")
+        or any(
+            field.exclude or getattr(field, "exclude_if", None)
+            for field in model.model_fields.values()
+        )
+        # Field-level PlainSerializer / WrapSerializer annotations
+        or _has_serializer(model.__pydantic_core_schema__)
+    )
+
+
+def model_row_data(item: BaseModel) -> Dict[str, Any]:
+    """Return an item's field values, skipping ``model_dump`` for flat models.
+
+    Extracted items were already validated, so a model without custom
+    serialization whose values are all scalars dumps to its own attributes.
+    """
+    values = item.__dict__
+    if _dumps_as_attributes(type(item)) and not any(
+        isinstance(value, _CONTAINER_TYPES) for value in values.values()
+    ):
+        return dict(values)
+    return item.model_dump()
+
+
 def flatten_extracted_data(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
     """Flatten nested extracted data for DataFrame storage."""
-    flattened = {}
+    flattened: Dict[str, Any] = {}
+    dumps = json.dumps
+    # Walk with a stack of item iterators so keys keep their depth-first order
+    stack = [(prefix, iter(data.items()))]
 
-    for key, value in data.items():
-        new_key = f"{prefix}_{key}" if prefix else key
+    while stack:
+        parent, entries = stack[-1]
+        for key, value in entries:
+            new_key = f"{parent}_{key}" if parent else key
 
-        if isinstance(value, dict):
-            flattened.update(flatten_extracted_data(value, new_key))
-        elif isinstance(value, list):
-            if value and isinstance(value[0], dict):
-                for index, item in enumerate(value):
-                    flattened.update(flatten_extracted_data(item, f"{new_key}_{index}"))
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items())))
+                break
+            if isinstance(value, list):
+                if value and isinstance(value[0], dict):
+                    stack.append((new_key, iter(enumerate(value))))
+                    break
+                flattened[new_key] = dumps(value)
             else:
-                flattened[new_key] = json.dumps(value)
+                flattened[new_key] = value
         else:
-            flattened[new_key] = value
+            stack.pop()
 
     return flattened
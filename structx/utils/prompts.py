@@ -1,6 +1,7 @@
-from string import Template
+from typing import Final, Sequence
 
-extraction_plan_system_prompt = """You design complete structured extraction plans.
+extraction_plan_system_prompt: Final = """\
+You design complete structured extraction plans.
 Return explicit instructions, target input columns, and a model schema that agree.
 Use only these field type forms: str, int, float, bool, date, datetime, time,
 Decimal, UUID, Any, List[T], Dict[str, T], Set[T], and Optional[T].
@@ -12,30 +13,34 @@ Do not add Optional unless it clarifies intent.
 Represent nested objects with nested_fields and use List[Any] or Dict[str, Any]
 only when a more precise type cannot be determined."""
 
-extraction_plan_template = Template("""
-    Build one complete extraction plan for this request.
 
-    Original query:
-    ${query}
+def render_extraction_plan(
+    query: str, available_columns: Sequence[str], sample_text: str
+) -> str:
+    """Render the user prompt that asks for a complete extraction plan."""
+    return f"""Build one complete extraction plan for the request below.
 
-    Available input columns:
-    ${available_columns}
+Requirements:
+1. Turn the query into concise, explicit extraction instructions.
+2. Select target_columns only from the available input columns.
+3. Define the smallest model schema that fully answers the query. Prefer a few
+   focused fields over an exhaustive document audit.
+4. Use nested_fields for structured objects and canonical field types exactly as instructed.
+5. Express presence and nullability with required and nullable, not JSON Schema syntax.
+6. Do not add catch-all summaries, issue inventories, metadata, or unrelated legal
+   terms unless the query explicitly requests them.
 
-    Representative input:
-    ${sample_text}
+Original query:
+{query}
 
-    Requirements:
-    1. Turn the query into concise, explicit extraction instructions.
-    2. Select target_columns only from the available input columns.
-    3. Define the smallest model schema that fully answers the query. Prefer a few
-       focused fields over an exhaustive document audit.
-    4. Use nested_fields for structured objects and canonical field types exactly as instructed.
-    5. Express presence and nullability with required and nullable, not JSON Schema syntax.
-    6. Do not add catch-all summaries, issue inventories, metadata, or unrelated legal
-       terms unless the query explicitly requests them.
-    """)
+Available input columns:
+{available_columns}
 
-extraction_system_prompt = """
+Representative input:
+{sample_text}"""
+
+
+extraction_system_prompt: Final = """\
 You are a precise data extraction system specialized in transforming raw data into structured formats. Always:
 1. Return structured objects for complex data according to the specified model
 2. Maintain consistent formats and data types as defined in the schema
@@ -45,53 +50,75 @@ You are a precise data extraction system specialized in transforming raw data in
 6. Return lists when the field expects a list of items
 7. Be thorough but do not invent data that isn't present in the source
 8. Only make inferences when there is strong supporting evidence in the data
-9. When working with custom models, leave nullable fields as null rather than inventing values
-"""
+9. When working with custom models, leave nullable fields as null rather than inventing values"""
+
+
+# Operation-level instructions live in the system message so every row request
+# in an operation shares one stable, cacheable prompt prefix. Fixed notes come
+# before the instructions so the prefix is also shared across operations.
+def render_extraction_instructions(instructions: str) -> str:
+    """Render operation-level extraction instructions."""
+    return f"""Important Notes:
+- Always return a list of structured objects
+- For list fields, return an array of items
+- Each item in a list should follow the specified structure
+- Use null/None for nullable fields when no reliable information is available (do NOT invent data)
+- Dates should be in ISO format (YYYY-MM-DDTHH:MM:SS)
+- For fields with enumerated values, use only values from the provided options
+- It's better to leave a field null than to fill it with incorrect information
+
+Extract structured information using these instructions:
+
+{instructions}"""
+
+
+def render_extraction_text(text: str) -> str:
+    """Render the user prompt for one row of text."""
+    return f"""Text to analyze:
+{text}"""
 
-extraction_template = Template("""
-    Extract structured information using these instructions:
 
-    ${instructions}
+def render_batch_extraction_text(texts: Sequence[str]) -> str:
+    """Render one user prompt for several rows, each tagged with its index."""
+    indexed_texts = "\n\n".join(
+        f"[{index}]\n{text}" for index, text in enumerate(texts)
+    )
+    return f"""Texts to analyze, each preceded by its [index]:
 
-    Important Notes:
-    - Always return a list of structured objects
-    - For list fields, return an array of items
-    - Each item in a list should follow the specified structure
-    - Use null/None for nullable fields when no reliable information is available (do NOT invent data)
-    - Dates should be in ISO format (YYYY-MM-DDTHH:MM:SS)
-    - For fields with enumerated values, use only values from the provided options
-    - It's better to leave a field null than to fill it with incorrect information
+{indexed_texts}
+
+Return one entry per text with its index and only the items extracted from
+that text. Use an empty list of items for a text with nothing to extract."""
 
-    Text to analyze:
-    ${text}
-    """)
 
 # Refinement prompt for existing models
-refinement_system_prompt = """You are a data model refinement specialist.
+refinement_system_prompt: Final = """\
+You are a data model refinement specialist.
 Analyze the existing model and the refinement instructions to create
 a new model that incorporates the requested changes."""
 
-refinement_template = Template("""
-    Refine the following data model according to these instructions:
-    
-    EXISTING MODEL SCHEMA:
-    ```json
-    ${model_schema}
-    ```
-    
-    REFINEMENT INSTRUCTIONS:
-    ${instructions}
-    
-    Create a new model schema that:
-    1. Keeps fields from the original model that shouldn't change
-    2. Modifies fields as specified in the instructions
-    3. Adds new fields as specified in the instructions
-    4. Removes fields as specified in the instructions
-    
-    Important: Use Pydantic v2 syntax:
-    - Use `pattern` instead of `regex` for string patterns
-    - Use `model_config` instead of `Config` class
-    - Use `Field` with validation parameters instead of validators where possible
-    
-    Include a clear description of the model and each field.
-    """)
+
+def render_refinement(model_schema: str, instructions: str) -> str:
+    """Render the user prompt for refining an existing model."""
+    return f"""Refine the data model below according to the instructions that follow it.
+
+Create a new model schema that:
+1. Keeps fields from the original model that shouldn't change
+2. Modifies fields as specified in the instructions
+3. Adds new fields as specified in the instructions
+4. Removes fields as specified in the instructions
+
+Important: Use Pydantic v2 syntax:
+- Use `pattern` instead of `regex` for string patterns
+- Use `model_config` instead of `Config` class
+- Use `Field` with validation parameters instead of validators where possible
+
+Include a clear description of the model and each field.
+
+EXISTING MODEL SCHEMA:
+```json
+{model_schema}
+```
+
+REFINEMENT INSTRUCTIONS:
+{instructions}"""
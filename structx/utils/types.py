@@ -1,10 +1,10 @@
-from typing import Any, Dict, ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
 
 from pydantic import BaseModel
 
 ResponseType = TypeVar("ResponseType")
 
-DictStrAny = Dict[str, Any]
+DictStrAny = dict[str, Any]
 
 # Type variables for parameters and return type
 T = TypeVar("T", bound=BaseModel)
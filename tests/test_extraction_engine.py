@@ -1,7 +1,9 @@
+import os
 from types import SimpleNamespace
 
+import pytest
 from instructor.processing.multimodal import PDF
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from structx.extraction.engines.extraction_engine import ExtractionEngine
 
@@ -33,3 +35,61 @@ def test_extract_with_multimodal_pdf_uses_current_instructor_api(sample_pdf_path
     assert llm_core.request is not None
     content = llm_core.request["messages"][1]["content"]
     assert isinstance(content[1], PDF)
+
+
+def test_text_rows_share_the_operation_system_prompt():
+    engine = ExtractionEngine(FakeLLMCore())
+
+    first = engine._text_messages("row one", Contact, "Extract the contact name")
+    second = engine._text_messages("row two", Contact, "Extract the contact name")
+
+    assert first[0] == second[0]
+    assert "Extract the contact name" in first[0]["content"]
+    assert "row one" in first[1]["content"]
+    assert "Extract the contact name" not in first[1]["content"]
+
+
+def test_row_message_keeps_template_syntax_in_text_verbatim():
+    text = "Costs $5 per ${unit} {currency}"
+
+    messages = ExtractionEngine._text_messages(text, Contact, "Extract costs")
+
+    assert messages[1]["content"] == f"Text to analyze:\n{text}"
+
+
+def test_system_prompts_share_their_static_notes_across_operations():
+    first = ExtractionEngine._system_prompt("Find names")
+    second = ExtractionEngine._system_prompt("List dates")
+
+    shared = os.path.commonprefix([first, second])
+
+    assert "Important Notes:" in shared
+    assert shared.rstrip().endswith("using these instructions:")
+
+
+@pytest.mark.parametrize(
+    "indices",
+    [[0], [0, 0], [0, 2]],
+    ids=["missing", "duplicate", "out-of-range"],
+)
+def test_grouped_response_must_cover_each_row_exactly_once(indices):
+    container_model = ExtractionEngine._batch_container_model(Contact, 2)
+    rows = [{"index": index, "items": []} for index in indices]
+
+    with pytest.raises(ValidationError, match="exactly once"):
+        container_model(rows=rows)
+
+
+def test_grouped_response_items_are_matched_by_index():
+    container_model = ExtractionEngine._batch_container_model(Contact, 2)
+    container = container_model(
+        rows=[
+            {"index": 1, "items": [{"name": "Grace Hopper"}]},
+            {"index": 0, "items": []},
+        ]
+    )
+
+    assert ExtractionEngine._items_per_text(container, 2) == [
+        [],
+        [Contact(name="Grace Hopper")],
+    ]
@@ -114,3 +114,91 @@ def test_explicit_prepared_input_can_be_inspected_and_reused_async():
 
     assert [item.value for item in result.data] == ["row-0"]
     assert prepared_input.closed
+
+
+def test_extract_queries_async_runs_queries_concurrently_under_one_row_limit(
+    monkeypatch,
+):
+    completions = TrackingAsyncCompletions()
+    extractor = Extractor(
+        client=SimpleNamespace(),
+        async_client=SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+        model_name="provider/model",
+        max_threads=2,
+        max_retries=0,
+    )
+    planning = {"active": 0, "max_active": 0}
+
+    async def generate_plan(**kwargs):
+        planning["active"] += 1
+        planning["max_active"] = max(planning["max_active"], planning["active"])
+        await asyncio.sleep(0.01)
+        planning["active"] -= 1
+        return SimpleNamespace(
+            instructions=kwargs["query"],
+            target_columns=["text"],
+            extraction_schema=object(),
+        )
+
+    monkeypatch.setattr(
+        extractor.model_operations, "generate_extraction_plan_async", generate_plan
+    )
+    monkeypatch.setattr(
+        extractor.model_operations,
+        "cached_model_from_schema",
+        lambda schema: AsyncRecord,
+    )
+
+    results = asyncio.run(
+        extractor.extract_queries_async(
+            data=[{"text": "row-0"}, {"text": "row-2"}],
+            queries=["first value", "second value", "third value"],
+            return_df=False,
+        )
+    )
+
+    assert list(results) == ["first value", "second value", "third value"]
+    for result in results.values():
+        assert [item.value for item in result.data] == ["row-0", "row-2"]
+    assert completions.max_active == 2
+    assert planning["max_active"] == 3
+
+
+def test_extract_async_groups_rows_and_fails_only_the_failed_request():
+    class GroupedCompletions:
+        def __init__(self):
+            self.requests = []
+
+        async def create_with_completion(self, **kwargs):
+            response_model = kwargs["response_model"]
+            self.requests.append(response_model.__name__)
+            if "rows" in response_model.model_fields:
+                raise ValueError("group failed")
+            result = response_model(items=[AsyncRecord(value="row-2")])
+            return result, SimpleNamespace(usage={"total_tokens": 3})
+
+    completions = GroupedCompletions()
+    extractor = Extractor(
+        client=SimpleNamespace(),
+        async_client=SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+        model_name="provider/model",
+        max_retries=0,
+        rows_per_request=2,
+    )
+
+    result = asyncio.run(
+        extractor.extract_async(
+            data=[{"text": "row-0"}, {"text": "row-1"}, {"text": "row-2"}],
+            query="extract value",
+            model=AsyncRecord,
+        )
+    )
+
+    assert sorted(completions.requests) == [
+        "AsyncRecordBatchContainer",
+        "AsyncRecordContainer",
+    ]
+    assert [row.status for row in result.rows] == ["failed", "failed", "success"]
+    assert "group failed" in result.rows[1].error
+    assert [item.value for item in result.data] == ["row-2"]
+    assert result.usage.total_tokens == 3
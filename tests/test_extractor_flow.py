@@ -1,4 +1,6 @@
+import threading
 from contextlib import contextmanager
+from pathlib import Path
 from types import SimpleNamespace
 
 import pandas as pd
@@ -6,8 +8,10 @@ import pytest
 from pydantic import BaseModel
 
 from structx.core.exceptions import ConfigurationError, ExtractionError
-from structx.core.input import PreparedInput
+from structx.core.input import PdfRow, PreparedInput
+from structx.core.models import ExtractionRequest, ModelField
 from structx.extraction.extractor import Extractor
+from structx.utils.usage import ExtractionStep
 
 
 def _unused_client():
@@ -19,6 +23,7 @@ def _unused_client():
     [
         ({"max_threads": 0}, "max_threads"),
         ({"batch_size": 0}, "batch_size"),
+        ({"rows_per_request": 0}, "rows_per_request"),
         ({"max_retries": -1}, "max_retries"),
         ({"min_wait": 2, "max_wait": 1}, "wait settings"),
     ],
@@ -118,6 +123,37 @@ def test_get_schema_accepts_caller_owned_prepared_input(monkeypatch):
     assert prepared_input.closed
 
 
+def test_get_schema_keeps_usage_separate_for_identical_schemas(monkeypatch):
+    extractor = Extractor(client=_unused_client(), model_name="provider/model")
+    schema = ExtractionRequest(
+        model_name="Terms",
+        model_description="Agreement terms",
+        fields=[ModelField(name="term", type="str", description="Term")],
+    )
+    token_counts = iter([10, 0])
+
+    def generate_extraction_plan(usage, **kwargs):
+        usage.add_step_usage(
+            ExtractionStep.SCHEMA_GENERATION,
+            {"prompt_tokens": next(token_counts), "completion_tokens": 0},
+        )
+        return SimpleNamespace(extraction_schema=schema)
+
+    monkeypatch.setattr(
+        extractor.model_operations,
+        "generate_extraction_plan",
+        generate_extraction_plan,
+    )
+
+    first = extractor.get_schema(data="agreement", query="extract terms")
+    second = extractor.get_schema(data="agreement", query="extract terms")
+
+    assert first is not second
+    assert first.model_json_schema() == second.model_json_schema()
+    assert first.usage.prompt_tokens == 10
+    assert second.usage.prompt_tokens == 0
+
+
 def test_prepare_input_context_cleans_up_after_an_error():
     extractor = Extractor(client=_unused_client(), model_name="provider/model")
 
@@ -128,3 +164,162 @@ def test_prepare_input_context_cleans_up_after_an_error():
             raise RuntimeError("stop inspection")
 
     assert prepared_input.closed
+
+
+def test_duplicate_rows_share_one_extraction_request():
+    class Record(BaseModel):
+        value: str
+
+    requests = []
+
+    def create_with_completion(**kwargs):
+        requests.append(kwargs["messages"][1]["content"])
+        completion = SimpleNamespace(usage={"total_tokens": 5})
+        return kwargs["response_model"](items=[Record(value="same")]), completion
+
+    extractor = Extractor(
+        client=SimpleNamespace(
+            chat=SimpleNamespace(
+                completions=SimpleNamespace(
+                    create_with_completion=create_with_completion
+                )
+            )
+        ),
+        model_name="provider/model",
+        max_threads=2,
+        max_retries=0,
+    )
+
+    result = extractor.extract(
+        data=[{"text": "repeated"}, {"text": "other"}, {"text": "repeated"}],
+        query="extract value",
+        model=Record,
+    )
+
+    assert len(requests) == 2
+    assert [row.status for row in result.rows] == ["success"] * 3
+    assert result.rows[2].items == result.rows[0].items
+    assert result.rows[2].items[0] is not result.rows[0].items[0]
+    assert result.usage.total_tokens == 10
+
+
+def test_grouped_rows_share_requests_and_keep_row_alignment():
+    class Record(BaseModel):
+        value: str
+
+    requests = []
+
+    def create_with_completion(**kwargs):
+        content = kwargs["messages"][1]["content"]
+        requests.append(content)
+        response_model = kwargs["response_model"]
+        completion = SimpleNamespace(usage={"total_tokens": 7})
+        if "rows" not in response_model.model_fields:
+            return response_model(items=[Record(value="gamma")]), completion
+        row_model = response_model.model_fields["rows"].annotation.__args__[0]
+        # Answer out of order to check that rows are matched by index
+        rows = [
+            row_model(index=1, items=[Record(value="beta")]),
+            row_model(index=0, items=[Record(value="alpha")]),
+        ]
+        return response_model(rows=rows), completion
+
+    extractor = Extractor(
+        client=SimpleNamespace(
+            chat=SimpleNamespace(
+                completions=SimpleNamespace(
+                    create_with_completion=create_with_completion
+                )
+            )
+        ),
+        model_name="provider/model",
+        max_threads=1,
+        max_retries=0,
+        rows_per_request=2,
+    )
+
+    result = extractor.extract(
+        data=[
+            {"text": "alpha"},
+            {"text": "beta"},
+            {"text": "alpha"},
+            {"text": "gamma"},
+        ],
+        query="extract value",
+        model=Record,
+    )
+
+    assert len(requests) == 2
+    assert "[0]" in requests[0] and "[1]" in requests[0]
+    assert [[item.value for item in row.items] for row in result.rows] == [
+        ["alpha"],
+        ["beta"],
+        ["alpha"],
+        ["gamma"],
+    ]
+    assert result.rows[2].items[0] is not result.rows[0].items[0]
+    assert [row.usage.total_tokens for row in result.rows] == [7, 0, 0, 7]
+    assert result.usage.total_tokens == 14
+
+
+def test_grouped_rows_extract_pdf_rows_concurrently(monkeypatch, tmp_path):
+    class Record(BaseModel):
+        value: str
+
+    extractor = Extractor(
+        client=_unused_client(),
+        model_name="provider/model",
+        max_threads=3,
+        max_retries=0,
+        rows_per_request=4,
+    )
+    # Both PDF rows must be in flight at once for the barrier to open
+    pdfs_in_flight = threading.Barrier(2, timeout=2)
+    text_groups = []
+
+    def extract_pdf(pdf_path, extraction_model, instructions, usage):
+        pdfs_in_flight.wait()
+        return [Record(value=Path(pdf_path).stem)]
+
+    def extract_texts(texts, extraction_model, instructions, usage):
+        text_groups.append(texts)
+        return [[Record(value=text.split("|")[-2].strip())] for text in texts]
+
+    monkeypatch.setattr(
+        extractor.extraction_engine, "extract_with_multimodal_pdf", extract_pdf
+    )
+    monkeypatch.setattr(
+        extractor.extraction_engine, "extract_from_texts", extract_texts
+    )
+    prepared_input = PreparedInput(
+        dataframe=pd.DataFrame({"text": ["alpha", "first", "second", "beta"]}),
+        pdf_rows={
+            1: PdfRow(pdf_path=tmp_path / "first.pdf", source=tmp_path / "first.md"),
+            2: PdfRow(pdf_path=tmp_path / "second.pdf", source=tmp_path / "second.md"),
+        },
+    )
+
+    result = extractor.extract(data=prepared_input, query="extract value", model=Record)
+
+    assert len(text_groups) == 1 and len(text_groups[0]) == 2
+    assert [row.status for row in result.rows] == ["success"] * 4
+    assert [[item.value for item in row.items] for row in result.rows] == [
+        ["alpha"],
+        ["first"],
+        ["second"],
+        ["beta"],
+    ]
+
+
+def test_schema_sample_truncates_long_cells():
+    extractor = Extractor(client=_unused_client(), model_name="provider/model")
+    long_text = "incident " * 1000
+    prepared_input = PreparedInput(
+        dataframe=pd.DataFrame({"text": [long_text, "short"], "id": [1, 2]})
+    )
+
+    sample = extractor._create_schema_sample(prepared_input)
+
+    assert "incident " * 300 not in sample
+    assert "short" in sample
+    assert "id" in sample
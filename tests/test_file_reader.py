@@ -93,6 +93,21 @@ def test_read_structured_csv_uses_pandas_reader(tmp_path):
     assert df["message"].tolist() == ["hello", "world"]
 
 
+def test_read_structured_jsonl_reads_one_record_per_line(tmp_path):
+    jsonl_path = tmp_path / "incidents.jsonl"
+    jsonl_path.write_text(
+        '{"id": 1, "message": "hello"}\n{"id": 2, "message": "world"}\n',
+        encoding="utf-8",
+    )
+
+    df = FileReader.read_file(jsonl_path).dataframe
+
+    assert df.to_dict(orient="records") == [
+        {"id": 1, "message": "hello"},
+        {"id": 2, "message": "world"},
+    ]
+
+
 def test_read_document_file_converts_to_multimodal_pdf(monkeypatch, sample_docx_path):
     calls = install_fake_document_modules(monkeypatch)
 
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from pathlib import Path
 
 import pandas as pd
@@ -130,6 +132,92 @@ def test_process_in_batches_passes_tabular_rows_as_markdown():
     assert "world" in seen[1][2]
 
 
+def test_process_in_batches_reuses_worker_threads_across_batches():
+    def worker(row_data, row_position, row_label):
+        return threading.current_thread().name
+
+    df = pd.DataFrame({"message": ["one", "two", "three"]})
+
+    thread_names = BatchProcessor(max_threads=1, batch_size=1).map_rows(
+        PreparedInput(dataframe=df),
+        worker,
+        ["message"],
+    )
+
+    assert len(thread_names) == 3
+    assert len(set(thread_names)) == 1
+
+
+def test_map_row_groups_groups_rows_within_each_batch():
+    groups = []
+
+    def worker(tasks):
+        groups.append([position for _, position, _ in tasks])
+        return [f"row-{position}" for _, position, _ in tasks]
+
+    df = pd.DataFrame({"message": ["a", "b", "c", "d", "e"]})
+
+    results = BatchProcessor(max_threads=1, batch_size=3).map_row_groups(
+        PreparedInput(dataframe=df), worker, ["message"], 2
+    )
+
+    assert groups == [[0, 1], [2], [3, 4]]
+    assert results == ["row-0", "row-1", "row-2", "row-3", "row-4"]
+
+
+def test_map_row_groups_gives_pdf_rows_their_own_groups(tmp_path):
+    groups = []
+
+    def worker(tasks):
+        groups.append([position for _, position, _ in tasks])
+        return [f"row-{position}" for _, position, _ in tasks]
+
+    async def async_worker(tasks):
+        return worker(tasks)
+
+    pdf_row = PdfRow(pdf_path=tmp_path / "doc.pdf", source=tmp_path / "doc.md")
+    prepared_input = PreparedInput(
+        dataframe=pd.DataFrame({"message": ["a", "doc", "c", "d"]}),
+        pdf_rows={1: pdf_row},
+    )
+
+    results = BatchProcessor(max_threads=1).map_row_groups(
+        prepared_input, worker, ["message"], 3
+    )
+    async_results = asyncio.run(
+        BatchProcessor(max_threads=1).map_row_groups_async(
+            prepared_input, async_worker, ["message"], 3
+        )
+    )
+
+    assert groups == [[1], [0, 2, 3]] * 2
+    assert results == async_results == ["row-0", "row-1", "row-2", "row-3"]
+
+
+def test_row_payload_does_not_depend_on_the_index_label():
+    df = pd.DataFrame({"message": ["same", "same"]}, index=["first", "second"])
+    prepared_input = PreparedInput(dataframe=df)
+
+    first = prepared_input.row_payload(0, df.iloc[0], ["message"])
+    second = prepared_input.row_payload(1, df.iloc[1], ["message"])
+
+    assert first == second
+    assert "first" not in first
+
+
+def test_row_payloads_match_single_row_payloads(tmp_path):
+    df = pd.DataFrame({"message": ["hello", "world"], "code": ["12", "7"]})
+    pdf_row = PdfRow(pdf_path=tmp_path / "doc.pdf", source=tmp_path / "doc.md")
+    prepared_input = PreparedInput(dataframe=df, pdf_rows={1: pdf_row})
+
+    payloads = prepared_input.row_payloads(0, 2, ["message", "code"])
+
+    assert payloads == [
+        prepared_input.row_payload(0, df.iloc[0], ["message", "code"]),
+        pdf_row,
+    ]
+
+
 def test_process_batch_passes_pdf_rows_as_typed_payloads(tmp_path):
     seen = []
 
@@ -240,6 +240,48 @@ def test_llm_core_retries_only_transient_failures():
     assert permanent.calls == 1
 
 
+def test_llm_core_rebuilds_retry_wrappers_when_settings_change():
+    class RateLimitError(Exception):
+        status_code = 429
+
+    class FailingCompletions:
+        def __init__(self):
+            self.calls = 0
+
+        def create_with_completion(self, **kwargs):
+            self.calls += 1
+            raise RateLimitError("rate limited")
+
+    completions = FailingCompletions()
+    core = LLMCore(
+        SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+        "provider/model",
+        ExtractionConfig(),
+        max_retries=2,
+        min_wait=0,
+        max_wait=0,
+    )
+
+    def complete():
+        with pytest.raises(Exception, match="rate limited"):
+            core.complete(
+                messages=[{"role": "user", "content": "extract"}],
+                response_model=CompletionResult,
+                step=ExtractionStep.EXTRACTION,
+            )
+
+    wrappers = core._retrying_completions()
+    complete()
+    assert completions.calls == 3
+    assert core._retrying_completions() == wrappers
+
+    completions.calls = 0
+    core.max_retries = 0
+    complete()
+    assert completions.calls == 1
+    assert core._retrying_completions() != wrappers
+
+
 def test_llm_core_async_completion_retries_and_tracks_usage():
     class TransientError(Exception):
         status_code = 429
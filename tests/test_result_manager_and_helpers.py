@@ -1,9 +1,16 @@
+import json
+from typing import Annotated
+
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PlainSerializer, WrapSerializer
 
 from structx.core.models import ExtractionResult, RowResult
 from structx.extraction.result_manager import ResultCollector
-from structx.utils.helpers import flatten_extracted_data
+from structx.utils.helpers import (
+    flatten_extracted_data,
+    model_row_data,
+    model_schema_json,
+)
 from structx.utils.usage import ExtractorUsage
 
 
@@ -32,6 +39,61 @@ def test_flatten_extracted_data_handles_nested_dicts_and_lists():
     }
 
 
+def test_model_schema_json_is_generated_once_per_model(monkeypatch):
+    class CachedItem(NestedItem):
+        pass
+
+    calls = []
+    original = CachedItem.model_json_schema.__func__
+
+    def counting_schema(cls, *args, **kwargs):
+        calls.append(cls)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(CachedItem, "model_json_schema", classmethod(counting_schema))
+
+    first = model_schema_json(CachedItem)
+
+    assert model_schema_json(CachedItem) is first
+    assert json.loads(first)["title"] == "CachedItem"
+    assert calls == [CachedItem]
+
+
+def test_model_row_data_skips_dump_only_for_flat_items():
+    class FlatItem(BaseModel):
+        name: str
+        count: int
+
+    flat = FlatItem(name="incident", count=2)
+    nested = NestedItem(name="incident", details={"date": "2026"}, tags=["a"])
+
+    assert model_row_data(flat) == flat.model_dump()
+    assert model_row_data(flat) is not flat.__dict__
+    assert model_row_data(nested) == nested.model_dump()
+
+
+def test_model_row_data_applies_field_serializers():
+    class SerializedItem(BaseModel):
+        amount: Annotated[float, PlainSerializer(lambda value: round(value, 2))]
+        code: Annotated[
+            str, WrapSerializer(lambda value, handler: handler(value).upper())
+        ]
+
+    item = SerializedItem(amount=1.23456, code="abc")
+
+    assert model_row_data(item) == {"amount": 1.23, "code": "ABC"}
+
+
+def test_model_row_data_drops_excluded_fields():
+    class ItemWithExcludedField(BaseModel):
+        name: str
+        internal_note: str = Field(exclude=True)
+
+    item = ItemWithExcludedField(name="incident", internal_note="skip me")
+
+    assert model_row_data(item) == {"name": "incident"}
+
+
 def test_result_collector_initializes_and_updates_dataframe():
     df = pd.DataFrame({"source": ["row"]})
     collector = ResultCollector(
@@ -129,7 +191,7 @@ def test_result_collector_does_not_copy_source_for_list_results():
 
     result = collector.build(ExtractorUsage())
 
-    assert collector.result_df is None
+    assert collector.columns is None
     assert result.data == [NestedItem(name="item", details={}, tags=[])]
 
 
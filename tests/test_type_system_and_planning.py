@@ -263,6 +263,54 @@ def test_extraction_plan_is_generated_in_one_llm_call():
     assert result.target_columns == ["source", "pdf_path"]
 
 
+def test_repeated_extraction_plans_reuse_the_first_model_call():
+    plan = ExtractionPlan(
+        instructions="Extract terms",
+        target_columns=["text"],
+        schema=ExtractionRequest(
+            model_name="Terms",
+            model_description="Agreement terms",
+            fields=[ModelField(name="term", type="str", description="Term")],
+        ),
+    )
+    llm_core = FakeLLMCore(plan)
+    operations = ModelOperations(llm_core)
+
+    def generate(query):
+        return operations.generate_extraction_plan(
+            query=query,
+            sample_text="Payment is due monthly.",
+            data_columns=["text"],
+            usage=ExtractorUsage(),
+        )
+
+    first = generate("Extract terms")
+    first.target_columns.append("mutated")
+    repeated = generate("Extract terms")
+    generate("Extract parties")
+
+    assert len(llm_core.requests) == 2
+    assert repeated is not first
+    assert repeated.target_columns == ["text"]
+
+
+def test_identical_schemas_reuse_the_generated_model():
+    def request(description):
+        return ExtractionRequest(
+            model_name="Terms",
+            model_description=description,
+            fields=[ModelField(name="term", type="str", description="Term")],
+        )
+
+    operations = ModelOperations(FakeLLMCore(None))
+
+    first = operations.cached_model_from_schema(request("Agreement terms"))
+
+    assert operations.cached_model_from_schema(request("Agreement terms")) is first
+    assert operations.cached_model_from_schema(request("Other terms")) is not first
+    assert operations.create_model_from_schema(request("Agreement terms")) is not first
+
+
 def test_extraction_plan_attaches_pdf_when_text_sample_is_unavailable(
     sample_pdf_path,
 ):